@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+from packaging.version import InvalidVersion, Version
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from maintenance_robot.versions import parse_version, select_latest  # noqa: E402
+
+
+def build_tags(count: int, seed: int = 0) -> list[str]:
+    """Docker Hub-like tag mix: versions, prereleases and non-version aliases."""
+    rng = random.Random(seed)
+    aliases = ["latest", "bookworm", "slim", "alpine", "edge", "nightly", "main"]
+    tags: list[str] = []
+    for _ in range(count):
+        roll = rng.random()
+        version = f"{rng.randint(0, 30)}.{rng.randint(0, 20)}.{rng.randint(0, 50)}"
+        if roll < 0.35:
+            tags.append(f"{rng.choice(aliases)}-{rng.randint(1, 9)}")
+        elif roll < 0.45:
+            tags.append(f"sha-{rng.getrandbits(28):07x}")
+        elif roll < 0.55:
+            tags.append(f"{version}rc{rng.randint(1, 4)}")
+        else:
+            tags.append(version)
+    return tags
+
+
+def legacy_select(tags: list[str], max_major: int | None) -> tuple[Version, str] | None:
+    candidates: list[tuple[Version, str]] = []
+    for tag in tags:
+        try:
+            version = Version(tag)
+        except InvalidVersion:
+            continue
+        if version.is_prerelease:
+            continue
+        if max_major is not None and version.major > max_major:
+            continue
+        candidates.append((version, tag))
+    if not candidates:
+        return None
+    candidates.sort(reverse=True)
+    return candidates[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare version-candidate selection strategies.")
+    parser.add_argument("--tags", type=int, default=5000, help="number of synthetic tags (default: 5000)")
+    parser.add_argument("--repeat", type=int, default=20, help="timed iterations per strategy (default: 20)")
+    parser.add_argument("--max-major", type=int, default=20)
+    args = parser.parse_args()
+
+    tags = build_tags(args.tags)
+    expected = legacy_select(tags, args.max_major)
+    if select_latest(tags, max_major=args.max_major) != expected:
+        raise SystemExit("select_latest disagrees with the legacy selection")
+
+    def cold() -> None:
+        parse_version.cache_clear()
+        select_latest(tags, max_major=args.max_major)
+
+    results = {
+        "legacy (Version + sort)": timeit.timeit(lambda: legacy_select(tags, args.max_major), number=args.repeat),
+        "select_latest (cold cache)": timeit.timeit(cold, number=args.repeat),
+        "select_latest (warm cache)": timeit.timeit(lambda: select_latest(tags, max_major=args.max_major), number=args.repeat),
+    }
+    print(f"{args.tags} tags, {args.repeat} iterations, best={expected[1] if expected else None}")
+    for label, seconds in results.items():
+        print(f"  {label:<28} {seconds / args.repeat * 1000:8.2f} ms/run")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,24 @@ import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
+from .homebrew_index import CASK_TAP, CORE_TAP, HomebrewIndex
+
 logger = logging.getLogger(__name__)
 
 _TAP_RE = re.compile(r'^\s*tap\s+"([^"]+)"')
 _BREW_RE = re.compile(r'^\s*brew\s+"([^"]+)"')
 _CASK_RE = re.compile(r'^\s*cask\s+"([^"]+)"')
 
+DEFAULT_INFO_BATCH_SIZE = 50
+DEFAULT_TAP_WORKERS = 4
+
+_INDEXED_TAPS = (CORE_TAP, CASK_TAP)
+
 
 @dataclass(frozen=True)
 class BrewfileValidationIssue:
@@ -41,8 +49,19 @@ class TapEntries:
 class BrewfileValidator:
     """Validate curated Brewfiles without installing their full contents."""
 
-    def __init__(self, brew_executable: str | None = None, require_brew: bool | None = None) -> None:
+    def __init__(
+        self,
+        brew_executable: str | None = None,
+        require_brew: bool | None = None,
+        batch_size: int = DEFAULT_INFO_BATCH_SIZE,
+        tap_workers: int = DEFAULT_TAP_WORKERS,
+        index: HomebrewIndex | None = None,
+    ) -> None:
         self.brew_executable = brew_executable or shutil.which("brew")
+        self.index = index
+        self.batch_size = max(1, batch_size)
+        self.tap_workers = max(1, tap_workers)
+        self._tap_info: dict[str, tuple[str | None, TapEntries | None]] = {}
         self.require_brew = require_brew if require_brew is not None else _env_flag("CI") or _env_flag(
             "REQUIRE_BREWFILE_VALIDATION"
         )
@@ -53,8 +72,13 @@ class BrewfileValidator:
         Validation intentionally mirrors brew bundle resolution closely enough to
         catch missing taps or renamed formulae before image builds or
         on-demand installs hit them.
+
+        When a Homebrew API ``index`` is supplied, core taps, formulae and
+        casks it knows about (including aliases and renames) are validated
+        offline; only third-party taps and names the index misses fall back to
+        the ``brew`` subprocess backend.
         """
-        if not self.brew_executable:
+        if not self.brew_executable and self.index is None:
             detail = "brew not found in PATH; cannot validate curated Brewfiles"
             if self.require_brew:
                 logger.error(detail)
@@ -75,10 +99,20 @@ class BrewfileValidator:
             logger.info("No Brewfiles found in %s", brew_dir)
             return []
 
-        issues: List[BrewfileValidationIssue] = []
+        parsed_brewfiles = [(brewfile, *self._parse_brewfile(brewfile)) for brewfile in brewfiles]
+        if self.index is not None:
+            parsed_brewfiles = [self._filter_with_index(*entry) for entry in parsed_brewfiles]
+            if not self.brew_executable:
+                return self._validate_without_brew(brew_dir, parsed_brewfiles)
 
-        for brewfile in brewfiles:
-            taps, formulae, casks = self._parse_brewfile(brewfile)
+        # Taps shared by several Brewfiles are queried once per directory run.
+        self._resolve_taps([tap for _, taps, _, _ in parsed_brewfiles for tap in taps], brew_dir)
+
+        parsed: list[tuple[Path, list[str], list[str]]] = []
+        tap_issues: dict[Path, List[BrewfileValidationIssue]] = {}
+        pending: dict[str, dict[str, None]] = {"formula": {}, "cask": {}}
+
+        for brewfile, taps, formulae, casks in parsed_brewfiles:
             tap_entries: dict[str, TapEntries] = {}
             logger.info(
                 "Validating %s (%d taps, %d formulae, %d casks)",
@@ -88,38 +122,134 @@ class BrewfileValidator:
                 len(casks),
             )
 
+            tap_issues[brewfile] = []
             for tap in taps:
                 issue, entries = self._load_tap_entries(brewfile, tap)
                 if issue:
-                    issues.append(issue)
+                    tap_issues[brewfile].append(issue)
                 elif entries:
                     tap_entries[tap] = entries
 
-            for formula in formulae:
-                if self._tap_entries_include(tap_entries, "formula", formula):
-                    continue
+            unchecked_formulae = [
+                name for name in formulae if not self._tap_entries_include(tap_entries, "formula", name)
+            ]
+            unchecked_casks = [
+                name for name in casks if not self._tap_entries_include(tap_entries, "cask", name)
+            ]
+            pending["formula"].update(dict.fromkeys(unchecked_formulae))
+            pending["cask"].update(dict.fromkeys(unchecked_casks))
+            parsed.append((brewfile, unchecked_formulae, unchecked_casks))
+
+        # Every formula/cask not covered by tap-info is checked across all
+        # Brewfiles at once, so each `brew` Ruby boot validates a whole batch.
+        failures = {
+            entry_type: self._find_failures(entry_type, list(names), brew_dir)
+            for entry_type, names in pending.items()
+        }
 
-                issue = self._run_check(
-                    brewfile,
-                    "formula",
-                    formula,
-                    ["info", "--json=v2", "--formula", formula],
-                )
-                if issue:
-                    issues.append(issue)
+        issues: List[BrewfileValidationIssue] = []
+        for brewfile, unchecked_formulae, unchecked_casks in parsed:
+            issues.extend(tap_issues[brewfile])
+            for entry_type, names in (("formula", unchecked_formulae), ("cask", unchecked_casks)):
+                for name in names:
+                    detail = failures[entry_type].get(name)
+                    if detail is None:
+                        continue
+                    logger.error(
+                        "Brewfile validation failed for %s %s in %s: %s",
+                        entry_type,
+                        name,
+                        brewfile.name,
+                        detail,
+                    )
+                    issues.append(
+                        BrewfileValidationIssue(
+                            brewfile=brewfile,
+                            entry_type=entry_type,
+                            name=name,
+                            detail=detail,
+                        )
+                    )
+
+        return issues
+
+    def _filter_with_index(
+        self,
+        brewfile: Path,
+        taps: list[str],
+        formulae: list[str],
+        casks: list[str],
+    ) -> tuple[Path, list[str], list[str], list[str]]:
+        """Drop entries the Homebrew API index confirms, leaving the rest for ``brew``."""
+        remaining_taps = [tap for tap in taps if tap not in _INDEXED_TAPS]
+        remaining_formulae = [name for name in formulae if not self._index_includes("formula", name)]
+        remaining_casks = [name for name in casks if not self._index_includes("cask", name)]
+        logger.info(
+            "Validated %d of %d %s entries against the Homebrew API index",
+            (len(taps) + len(formulae) + len(casks))
+            - (len(remaining_taps) + len(remaining_formulae) + len(remaining_casks)),
+            len(taps) + len(formulae) + len(casks),
+            brewfile.name,
+        )
+        return brewfile, remaining_taps, remaining_formulae, remaining_casks
+
+    def _index_includes(self, entry_type: str, name: str) -> bool:
+        assert self.index is not None
+        tap = _tap_name_from_entry(name)
+        if tap is not None and tap not in _INDEXED_TAPS:
+            return False
+        return self.index.contains(name, entry_type)
 
-            for cask in casks:
-                if self._tap_entries_include(tap_entries, "cask", cask):
-                    continue
+    def _validate_without_brew(
+        self,
+        brew_dir: Path,
+        parsed_brewfiles: list[tuple[Path, list[str], list[str], list[str]]],
+    ) -> List[BrewfileValidationIssue]:
+        """Report index misses when no ``brew`` executable can resolve them."""
+        issues: List[BrewfileValidationIssue] = []
+        unresolved_third_party = 0
+
+        for brewfile, taps, formulae, casks in parsed_brewfiles:
+            unresolved_third_party += len(taps)
+            for entry_type, names in (("formula", formulae), ("cask", casks)):
+                for name in names:
+                    if _tap_name_from_entry(name) not in (None, *_INDEXED_TAPS):
+                        unresolved_third_party += 1
+                        continue
+                    detail = f'No available {entry_type} with the name "{name}" in the Homebrew API index'
+                    logger.error(
+                        "Brewfile validation failed for %s %s in %s: %s",
+                        entry_type,
+                        name,
+                        brewfile.name,
+                        detail,
+                    )
+                    issues.append(
+                        BrewfileValidationIssue(
+                            brewfile=brewfile,
+                            entry_type=entry_type,
+                            name=name,
+                            detail=detail,
+                        )
+                    )
 
-                issue = self._run_check(
-                    brewfile,
-                    "cask",
-                    cask,
-                    ["info", "--json=v2", "--cask", cask],
+        if unresolved_third_party:
+            detail = (
+                f"brew not found in PATH; cannot validate {unresolved_third_party} "
+                "third-party tap entries missing from the Homebrew API index"
+            )
+            if self.require_brew:
+                logger.error(detail)
+                issues.append(
+                    BrewfileValidationIssue(
+                        brewfile=brew_dir,
+                        entry_type="tool",
+                        name="brew",
+                        detail=detail,
+                    )
                 )
-                if issue:
-                    issues.append(issue)
+            else:
+                logger.warning("%s; skipping them outside CI", detail)
 
         return issues
 
@@ -149,23 +279,29 @@ class BrewfileValidator:
 
         return taps, formulae, casks
 
+    def _resolve_taps(self, taps: list[str], cwd: Path) -> None:
+        """Query tap-info for every distinct, not yet memoized tap in parallel."""
+        missing = [tap for tap in dict.fromkeys(taps) if tap not in self._tap_info]
+        if not missing:
+            return
+
+        workers = max(1, min(self.tap_workers, len(missing)))
+        logger.info("Resolving %d distinct tap(s) with %d worker(s)", len(missing), workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="brew-tap-info") as executor:
+            results = executor.map(lambda tap: self._query_tap_info(tap, cwd), missing)
+            for tap, result in zip(missing, results):
+                self._tap_info[tap] = result
+
     def _load_tap_entries(
         self,
         brewfile: Path,
         tap: str,
     ) -> tuple[BrewfileValidationIssue | None, TapEntries | None]:
-        assert self.brew_executable is not None
-
-        result = subprocess.run(
-            [self.brew_executable, "tap-info", "--json", tap],
-            capture_output=True,
-            text=True,
-            cwd=str(brewfile.parent),
-        )
+        if tap not in self._tap_info:
+            self._tap_info[tap] = self._query_tap_info(tap, brewfile.parent)
 
-        if result.returncode != 0:
-            detail = result.stderr.strip() or result.stdout.strip() or "tap validation failed"
-            detail = detail.splitlines()[-1]
+        detail, entries = self._tap_info[tap]
+        if detail is not None:
             logger.error("Brewfile validation failed for tap %s in %s: %s", tap, brewfile.name, detail)
             return (
                 BrewfileValidationIssue(
@@ -176,34 +312,30 @@ class BrewfileValidator:
                 ),
                 None,
             )
+        return None, entries
+
+    def _query_tap_info(self, tap: str, cwd: Path) -> tuple[str | None, TapEntries | None]:
+        """Run ``brew tap-info`` for one tap, returning a failure detail or its entries."""
+        assert self.brew_executable is not None
+
+        result = subprocess.run(
+            [self.brew_executable, "tap-info", "--json", tap],
+            capture_output=True,
+            text=True,
+            cwd=str(cwd),
+        )
+
+        if result.returncode != 0:
+            detail = result.stderr.strip() or result.stdout.strip() or "tap validation failed"
+            return detail.splitlines()[-1], None
 
         try:
             tap_info = json.loads(result.stdout)
         except json.JSONDecodeError as error:
-            detail = f"tap-info returned invalid JSON: {error}"
-            logger.error("Brewfile validation failed for tap %s in %s: %s", tap, brewfile.name, detail)
-            return (
-                BrewfileValidationIssue(
-                    brewfile=brewfile,
-                    entry_type="tap",
-                    name=tap,
-                    detail=detail,
-                ),
-                None,
-            )
+            return f"tap-info returned invalid JSON: {error}", None
 
         if not tap_info:
-            detail = "tap-info returned no tap metadata"
-            logger.error("Brewfile validation failed for tap %s in %s: %s", tap, brewfile.name, detail)
-            return (
-                BrewfileValidationIssue(
-                    brewfile=brewfile,
-                    entry_type="tap",
-                    name=tap,
-                    detail=detail,
-                ),
-                None,
-            )
+            return "tap-info returned no tap metadata", None
 
         return None, TapEntries.from_tap_info(tap_info[0])
 
@@ -225,34 +357,53 @@ class BrewfileValidator:
         # Untapped Homebrew metadata can omit entry lists even when the tap exists.
         return not names
 
-    def _run_check(
+    def _find_failures(self, entry_type: str, names: list[str], cwd: Path) -> dict[str, str]:
+        """Return the names that fail ``brew info``, mapped to the failure detail.
+
+        Names are checked ``batch_size`` at a time in a single ``brew info``
+        call. A failing batch is bisected until the offending names are isolated.
+        """
+        failures: dict[str, str] = {}
+        for offset in range(0, len(names), self.batch_size):
+            self._bisect_check(entry_type, names[offset:offset + self.batch_size], cwd, failures)
+        return failures
+
+    def _bisect_check(
         self,
-        brewfile: Path,
         entry_type: str,
-        name: str,
-        brew_args: list[str],
-    ) -> BrewfileValidationIssue | None:
+        names: list[str],
+        cwd: Path,
+        failures: dict[str, str],
+    ) -> None:
+        if not names:
+            return
+
+        detail = self._run_check(entry_type, names, cwd)
+        if detail is None:
+            return
+        if len(names) == 1:
+            failures[names[0]] = detail
+            return
+
+        middle = len(names) // 2
+        self._bisect_check(entry_type, names[:middle], cwd, failures)
+        self._bisect_check(entry_type, names[middle:], cwd, failures)
+
+    def _run_check(self, entry_type: str, names: list[str], cwd: Path) -> str | None:
         assert self.brew_executable is not None
 
         result = subprocess.run(
-            [self.brew_executable, *brew_args],
+            [self.brew_executable, "info", "--json=v2", f"--{entry_type}", *names],
             capture_output=True,
             text=True,
-            cwd=str(brewfile.parent),
+            cwd=str(cwd),
         )
 
         if result.returncode == 0:
             return None
 
         detail = result.stderr.strip() or result.stdout.strip() or f"{entry_type} validation failed"
-        detail = detail.splitlines()[-1]
-        logger.error("Brewfile validation failed for %s %s in %s: %s", entry_type, name, brewfile.name, detail)
-        return BrewfileValidationIssue(
-            brewfile=brewfile,
-            entry_type=entry_type,
-            name=name,
-            detail=detail,
-        )
+        return detail.splitlines()[-1]
 
 
 def _env_flag(name: str) -> bool:
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from . import http_session
+from .http_cache import default_cache
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+DEFAULT_HASH_WORKERS = 4
+
+
+class ChecksumCache:
+    """Persistent ``URL -> sha256`` map validated against the artifact's HTTP metadata.
+
+    Each lookup issues a ``HEAD`` request (following redirects) and compares the
+    final ``ETag``, ``Last-Modified`` and ``Content-Length`` with the values
+    recorded when the checksum was computed. Only a mismatch, or an artifact
+    without any of those validators, downloads and hashes the body again.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+
+    def sha256(self, url: str) -> Optional[str]:
+        """Return the hex SHA256 of ``url``'s content, or ``None`` if it cannot be fetched."""
+        try:
+            fingerprint = self._fingerprint(url)
+        except Exception as exc:
+            logger.debug("HEAD %s failed, hashing without cache: %s", url, exc)
+            fingerprint = None
+
+        if fingerprint is not None:
+            entry = self._load().get(url)
+            if entry and entry.get("fingerprint") == fingerprint:
+                logger.info("      ✓ SHA256 unchanged (cached): %s", url)
+                return entry["sha256"]
+
+        checksum = _hash_url(url)
+        if checksum is not None and fingerprint is not None:
+            with self._lock:
+                self._load()[url] = {"fingerprint": fingerprint, "sha256": checksum}
+            self._save()
+        return checksum
+
+    def sha256_many(self, urls: Iterable[str], max_workers: int = DEFAULT_HASH_WORKERS) -> Dict[str, Optional[str]]:
+        """Checksum several artifacts concurrently, returning ``{url: sha256}``."""
+        unique = list(dict.fromkeys(urls))
+        if not unique:
+            return {}
+        workers = max(1, min(max_workers, len(unique)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="checksum") as executor:
+            return dict(zip(unique, executor.map(self.sha256, unique)))
+
+    @staticmethod
+    def _fingerprint(url: str) -> Optional[Dict[str, str]]:
+        response = http_session.head(url, allow_redirects=True, timeout=30)
+        response.raise_for_status()
+        fingerprint = {
+            name: response.headers[header]
+            for name, header in (
+                ("etag", "ETag"),
+                ("last_modified", "Last-Modified"),
+                ("content_length", "Content-Length"),
+            )
+            if response.headers.get(header)
+        }
+        return fingerprint or None
+
+    def _load(self) -> Dict[str, dict]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = {}
+                if self.path is not None:
+                    try:
+                        data = json.loads(self.path.read_text(encoding="utf-8"))
+                    except FileNotFoundError:
+                        data = {}
+                    except (OSError, ValueError) as exc:
+                        logger.debug("Ignoring unreadable checksum cache %s: %s", self.path, exc)
+                        data = {}
+                    if isinstance(data, dict):
+                        self._entries = data
+            return self._entries
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            tmp_name = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                    json.dump(self._entries or {}, stream, indent=2, sort_keys=True)
+                os.replace(tmp_name, self.path)
+            except OSError as exc:
+                if tmp_name is not None:
+                    Path(tmp_name).unlink(missing_ok=True)
+                logger.debug("Failed to write checksum cache %s: %s", self.path, exc)
+
+
+def _hash_url(url: str) -> Optional[str]:
+    """Stream ``url`` through SHA256 in large chunks."""
+    try:
+        logger.info("      📥 Downloading to compute SHA256: %s", url)
+        response = http_session.get(url, timeout=60, stream=True)
+        response.raise_for_status()
+
+        sha256_hash = hashlib.sha256()
+        with response:
+            for chunk in response.iter_content(chunk_size=HASH_CHUNK_SIZE):
+                sha256_hash.update(chunk)
+
+        checksum = sha256_hash.hexdigest()
+        logger.info("      ✓ Computed SHA256: %s", checksum)
+        return checksum
+    except Exception as e:
+        logger.warning("      ⚠ Failed to compute SHA256 from %s: %s", url, e)
+        return None
+
+
+@lru_cache(maxsize=1)
+def default_checksum_cache() -> ChecksumCache:
+    """Return the process-wide checksum cache, stored alongside the HTTP response cache.
+
+    Keeping it under ``MAINTENANCE_HTTP_CACHE_DIR`` means CI persists both
+    together; when the HTTP cache is disabled, checksums are only remembered
+    for the current process.
+    """
+    http_cache = default_cache()
+    if http_cache is None:
+        return ChecksumCache()
+    return ChecksumCache(http_cache.cache_dir / "checksums" / "sha256.json")
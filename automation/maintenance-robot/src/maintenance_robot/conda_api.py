@@ -5,9 +5,11 @@ from dataclasses import dataclass
 from functools import lru_cache
 from typing import Optional
 
-import requests
-from packaging.version import InvalidVersion, Version
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from packaging.version import Version
+
+from .http_cache import cached_get
+from .http_session import api_retry
+from .versions import allowed_version, select_latest
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +26,9 @@ class PackageInfo:
     version_str: str
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=8),
-    stop=stop_after_attempt(4),
-    retry=retry_if_exception_type((requests.RequestException, CondaAPIError)),
-)
+@api_retry(CondaAPIError)
 def _get(url: str) -> dict:
-    response = requests.get(url, timeout=30)
+    response = cached_get(url, timeout=30)
     if response.status_code >= 400:
         raise CondaAPIError(f"Anaconda API error {response.status_code}: {response.text}")
     try:
@@ -58,44 +56,19 @@ def fetch_latest_version(
         platform_versions = data.get("platforms", {})
         version_str = platform_versions.get(platform)
         if version_str:
-            version = _to_allowed_version(version_str, include_prerelease, max_major)
+            version = allowed_version(version_str, include_prerelease, max_major)
             if version is not None:
                 return PackageInfo(version=version, version_str=version_str)
             logger.debug("Skipping Conda version %s for %s/%s on %s", version_str, channel, package, platform)
 
     latest = data.get("latest_version")
     if latest:
-        version = _to_allowed_version(latest, include_prerelease, max_major)
+        version = allowed_version(latest, include_prerelease, max_major)
         if version is not None:
             return PackageInfo(version=version, version_str=latest)
 
-    valid_versions: list[tuple[Version, str]] = []
-    for version_str in data.get("versions", []):
-        version = _to_allowed_version(version_str, include_prerelease, max_major)
-        if version is not None:
-            valid_versions.append((version, version_str))
-
-    if not valid_versions:
+    best = select_latest(data.get("versions", []), include_prerelease, max_major)
+    if best is None:
         return None
-
-    valid_versions.sort(reverse=True)
-    version, version_str = valid_versions[0]
+    version, version_str = best
     return PackageInfo(version=version, version_str=version_str)
-
-
-def _to_allowed_version(
-    version_str: str,
-    include_prerelease: bool,
-    max_major: Optional[int],
-) -> Optional[Version]:
-    try:
-        version = Version(version_str)
-    except InvalidVersion:
-        logger.debug("Skipping invalid Conda version: %s", version_str)
-        return None
-
-    if not include_prerelease and version.is_prerelease:
-        return None
-    if max_major is not None and version.major > max_major:
-        return None
-    return version
@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
+from urllib.parse import urlencode
 
-import requests
-from packaging.version import InvalidVersion, Version
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from packaging.version import Version
+
+from .http_cache import cached_get
+from .http_session import api_retry
+from .versions import allowed_version
 
 logger = logging.getLogger(__name__)
 
 DOCKER_HUB_API_ROOT = "https://hub.docker.com/v2/repositories"
+DEFAULT_PAGE_WINDOW = 4
 
 
 class DockerHubAPIError(RuntimeError):
@@ -31,42 +36,35 @@ def _normalize_digest(digest: Optional[str]) -> Optional[str]:
     return digest.removeprefix("sha256:")
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=8),
-    stop=stop_after_attempt(4),
-    retry=retry_if_exception_type((requests.RequestException, DockerHubAPIError)),
-)
 def fetch_latest_version(
     repo: str,
     tag_regex: str,
     include_prerelease: bool = False,
     max_major: Optional[int] = None,
     page_size: int = 100,
-    max_pages: int = 5,
+    max_pages: int = 10,
+    window: int = DEFAULT_PAGE_WINDOW,
 ) -> Optional[DockerHubTagInfo]:
-    """Fetch the highest-version Docker Hub tag matching the configured regex."""
+    """Fetch the highest-version Docker Hub tag matching the configured regex.
+
+    The longest literal in ``tag_regex`` is sent as Docker Hub's ``name=``
+    substring filter and results are ordered by ``last_updated``, so the newest
+    matching tags arrive first. The first page reports the total ``count``; the
+    remaining pages are fetched ``window`` at a time in parallel, stopping as
+    soon as a whole window fails to improve on the best tag found so far.
+    """
 
     pattern = re.compile(tag_regex)
-    candidates: list[DockerHubTagInfo] = []
-
-    for page in range(1, max_pages + 1):
-        url = f"{DOCKER_HUB_API_ROOT}/{repo}/tags?page_size={page_size}&page={page}"
-        response = requests.get(url, timeout=30)
-        if response.status_code >= 400:
-            raise DockerHubAPIError(
-                f"Docker Hub API error {response.status_code}: {response.text}"
-            )
-        try:
-            payload = response.json()
-        except ValueError as exc:
-            raise DockerHubAPIError("Failed to decode JSON from Docker Hub API") from exc
-
-        results = payload.get("results")
-        if not isinstance(results, list):
-            raise DockerHubAPIError("Expected list response from Docker Hub API")
-        if not results:
-            break
+    params = {"page_size": str(page_size), "ordering": "last_updated"}
+    name_filter = _literal_filter(tag_regex)
+    if name_filter:
+        params["name"] = name_filter
+    base_url = f"{DOCKER_HUB_API_ROOT}/{repo}/tags"
+
+    def page_url(page: int) -> str:
+        return f"{base_url}?{urlencode({**params, 'page': str(page)})}"
 
+    def best_of(results: list, current: Optional[DockerHubTagInfo]) -> Optional[DockerHubTagInfo]:
         for entry in results:
             tag_name = entry.get("name", "")
             match = pattern.fullmatch(tag_name)
@@ -78,24 +76,122 @@ def fetch_latest_version(
                 logger.debug("Skipping Docker Hub tag without version group: %s", tag_name)
                 continue
 
-            try:
-                version = Version(version_raw.lstrip("vV"))
-            except InvalidVersion:
-                logger.debug("Skipping invalid Docker Hub tag version: %s", tag_name)
-                continue
-
-            if version.is_prerelease and not include_prerelease:
+            version = allowed_version(version_raw.lstrip("vV"), include_prerelease, max_major)
+            if version is None:
                 continue
-            if max_major is not None and version.major > max_major:
-                continue
-
-            digest = _normalize_digest(entry.get("digest"))
-            candidates.append(DockerHubTagInfo(tag=tag_name, version=version, digest=digest))
-
-        if not payload.get("next"):
-            break
-
-    if not candidates:
+            if current is None or version > current.version:
+                current = DockerHubTagInfo(tag=tag_name, version=version, digest=_normalize_digest(entry.get("digest")))
+        return current
+
+    first = _fetch_page(page_url(1))
+    best = best_of(first["results"], None)
+    if not first.get("next"):
+        return best
+
+    count = first.get("count")
+    last_page = max_pages
+    if isinstance(count, int):
+        last_page = min(max_pages, -(-count // page_size))
+    remaining = list(range(2, last_page + 1))
+    if not remaining:
+        return best
+
+    with ThreadPoolExecutor(max_workers=max(1, min(window, len(remaining)))) as executor:
+        for offset in range(0, len(remaining), window):
+            pages = remaining[offset:offset + window]
+            improved = False
+            # map() preserves page order so ties resolve the same way as a serial scan
+            for payload in executor.map(_fetch_page, [page_url(page) for page in pages]):
+                candidate = best_of(payload["results"], best)
+                if candidate is not best:
+                    best, improved = candidate, True
+            if not improved:
+                logger.debug("Stopping Docker Hub scan of %s after page %d: no better tags", repo, pages[-1])
+                break
+            if not payload.get("next"):
+                break
+
+    return best
+
+
+@api_retry(DockerHubAPIError)
+def _fetch_page(url: str) -> dict:
+    response = cached_get(url, timeout=30)
+    if response.status_code >= 400:
+        raise DockerHubAPIError(
+            f"Docker Hub API error {response.status_code}: {response.text}"
+        )
+    try:
+        payload = response.json()
+    except ValueError as exc:
+        raise DockerHubAPIError("Failed to decode JSON from Docker Hub API") from exc
+
+    if not isinstance(payload, dict) or not isinstance(payload.get("results"), list):
+        raise DockerHubAPIError("Expected list response from Docker Hub API")
+    return payload
+
+
+def _literal_filter(tag_regex: str) -> Optional[str]:
+    """Return the longest run of characters every matching tag must contain.
+
+    Only top-level literals count: groups, classes, escapes such as ``\\d`` and
+    anything made optional by a quantifier end the current run. Patterns with a
+    top-level alternation or inline flags yield ``None`` (no server-side filter).
+    """
+    if "(?i" in tag_regex:
         return None
-
-    return max(candidates, key=lambda candidate: candidate.version)
+    runs: list[str] = []
+    current: list[str] = []
+    depth = 0
+    index = 0
+
+    def flush() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    while index < len(tag_regex):
+        char = tag_regex[index]
+        if char == "\\":
+            escaped = tag_regex[index + 1:index + 2]
+            if depth == 0 and escaped and not escaped.isalnum():
+                current.append(escaped)
+            else:
+                flush()
+            index += 2
+            continue
+        if char == "[":
+            flush()
+            index += 1
+            if tag_regex[index:index + 1] == "^":
+                index += 1
+            if tag_regex[index:index + 1] == "]":
+                index += 1
+            while index < len(tag_regex) and tag_regex[index] != "]":
+                index += 2 if tag_regex[index] == "\\" else 1
+        elif char == "(":
+            flush()
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|":
+            if depth == 0:
+                return None
+        elif char in "*?{":
+            # The preceding character may be absent from the tag
+            if current:
+                current.pop()
+            flush()
+            if char == "{":
+                index = tag_regex.find("}", index)
+                if index == -1:
+                    break
+        elif char in "+.^$":
+            flush()
+        elif depth == 0:
+            current.append(char)
+        index += 1
+    flush()
+
+    longest = max(runs, key=len, default="")
+    return longest if len(longest) >= 2 else None
@@ -1,23 +1,73 @@
 from __future__ import annotations
 
-import hashlib
 import logging
+import os
 import re
-import requests
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
 
-from packaging.version import InvalidVersion, Version
+from packaging.version import Version
 
+from . import http_session
+from .checksum_cache import ChecksumCache, default_checksum_cache
+from .conda_api import ANACONDA_API_ROOT
 from .conda_api import fetch_latest_version as fetch_conda_version
+from .docker_hub_api import DOCKER_HUB_API_ROOT
 from .docker_hub_api import fetch_latest_version as fetch_docker_hub_version
+from .github_api import GITHUB_API_ROOT, ReleaseInfo, ReleaseQuery
 from .github_api import fetch_latest_version as fetch_github_version
+from .github_api import fetch_latest_versions as fetch_github_versions
+from .npm_api import NPM_REGISTRY_ROOT
 from .npm_api import fetch_latest_version as fetch_npm_version
+from .oci_registry import OCIRegistryError
+from .oci_registry import resolve_digest as resolve_registry_digest
+from .pypi_api import PYPI_API_ROOT
 from .pypi_api import fetch_latest_version as fetch_pypi_version
 from .reporter import DownloadUpdate, MaintenanceReport
+from .versions import parse_version
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_RESOLVE_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 4
+
+_SOURCE_API_ROOTS = {
+    "pypi": PYPI_API_ROOT,
+    "npm": NPM_REGISTRY_ROOT,
+    "conda": ANACONDA_API_ROOT,
+    "docker_hub": DOCKER_HUB_API_ROOT,
+}
+
+
+@dataclass(frozen=True)
+class ResolvedDownload:
+    """Latest upstream version for one allowlist entry, as handed to the rewrite phase."""
+
+    version: Version
+    version_str: str
+    sha256: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _TargetJob:
+    identifier: str
+    config: dict
+    resolved: ResolvedDownload
+    target: dict
+
+
+@dataclass(frozen=True)
+class _Edit:
+    start: int
+    end: int
+    replacement: str
+
 
 class DownloadsUpdater:
     """Enhanced downloads updater with multi-pattern support and smart detection."""
@@ -27,136 +77,221 @@ class DownloadsUpdater:
         allowlist: Dict[str, dict],
         repo_root: Path,
         report: MaintenanceReport,
+        max_workers: int = DEFAULT_RESOLVE_WORKERS,
+        max_per_host: int = DEFAULT_PER_HOST_LIMIT,
+        checksum_cache: Optional[ChecksumCache] = None,
     ) -> None:
         self.allowlist = allowlist
         self.repo_root = repo_root
         self.report = report
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        self._github_releases: Dict[ReleaseQuery, Optional[ReleaseInfo]] = {}
+        self.checksum_cache = checksum_cache
+        self._checksums: Dict[str, Optional[str]] = {}
 
     def update_targets(self) -> None:
-        """Process all downloads from allowlist with comprehensive pattern matching."""
+        """Process all downloads from allowlist with comprehensive pattern matching.
+
+        Runs in two phases: every allowlist entry is resolved against its registry
+        concurrently first, then the finished resolution table drives the file
+        rewrites. Targets are grouped by file so each file is read once, receives
+        all version and SHA256 substitutions as one edit list, and is written at
+        most once. Checksums that must be computed from downloads are hashed
+        concurrently before any file is touched.
+        """
         logger.info("Processing %d download targets from allowlist", len(self.allowlist))
-        for identifier, config in self.allowlist.items():
-            logger.info("\n=== Processing: %s ===", identifier)
-            source = config.get("source", "release")
-            include_prerelease = bool(config.get("include_prerelease", False))
-            max_major = config.get("max_major")
-            version_format = config.get("version_format", "full")  # full, major_only, major_minor
-            latest_sha256 = None
-            logger.info("  Source: %s, Prerelease: %s, Max Major: %s", source, include_prerelease, max_major)
-
-            # Fetch version info based on source type
-            if source == "pypi":
-                package = config.get("package")
-                if not package:
-                    logger.warning("PyPI source requires 'package' field for %s", identifier)
-                    continue
-                logger.info("  Fetching PyPI package: %s", package)
-                package_info = fetch_pypi_version(
-                    package=package,
-                    include_prerelease=include_prerelease,
-                    max_major=max_major,
-                )
-                if package_info is None:
-                    logger.warning("  ⚠ No package info found for %s", identifier)
-                    continue
-                version = package_info.version
-                version_str = package_info.version_str
-                logger.info("  ✓ Latest PyPI version: %s", version_str)
-            elif source == "npm":
-                package = config.get("package")
-                if not package:
-                    logger.warning("npm source requires 'package' field for %s", identifier)
-                    continue
-                logger.info("  Fetching npm package: %s", package)
-                package_info = fetch_npm_version(
-                    package=package,
-                    include_prerelease=include_prerelease,
-                    max_major=max_major,
-                )
-                if package_info is None:
-                    logger.warning("  ⚠ No package info found for %s", identifier)
-                    continue
-                version = package_info.version
-                version_str = package_info.version_str
-                logger.info("  ✓ Latest npm version: %s", version_str)
-            elif source == "conda":
-                channel = config.get("channel", "conda-forge")
-                package = config.get("package")
-                platform = config.get("platform")
-                if not package:
-                    logger.warning("Conda source requires 'package' field for %s", identifier)
-                    continue
-                logger.info("  Fetching Conda package: %s/%s", channel, package)
-                package_info = fetch_conda_version(
-                    channel=channel,
-                    package=package,
-                    platform=platform,
-                    include_prerelease=include_prerelease,
-                    max_major=max_major,
-                )
-                if package_info is None:
-                    logger.warning("  ⚠ No package info found for %s", identifier)
-                    continue
-                version = package_info.version
-                version_str = package_info.version_str
-                logger.info("  ✓ Latest Conda version: %s", version_str)
-            elif source == "custom":
-                # Handle custom version fetching (e.g., Claude Code)
-                stable_version_url = config.get("stable_version_url")
-                if not stable_version_url:
-                    logger.warning("  ⚠ Custom source requires 'stable_version_url' field for %s", identifier)
-                    continue
-                logger.info("  Fetching custom version from: %s", stable_version_url)
-                try:
-                    response = requests.get(stable_version_url, timeout=30)
-                    response.raise_for_status()
-                    version_str = response.text.strip()
-                    version = self._to_version(version_str)
-                    if version is None:
-                        logger.warning("  ⚠ Could not parse version from custom source: %s", version_str)
-                        continue
-                    logger.info("  ✓ Latest custom version: %s", version_str)
-                except Exception as e:
-                    logger.warning("  ⚠ Failed to fetch custom version for %s: %s", identifier, e)
-                    continue
-            elif source == "docker_hub":
-                repo = config.get("repo")
-                tag_regex = config.get("tag_regex")
-                if not repo or not tag_regex:
-                    logger.warning(
-                        "Docker Hub source requires 'repo' and 'tag_regex' fields for %s",
-                        identifier,
-                    )
-                    continue
-                logger.info("  Fetching Docker Hub tag from repo: %s", repo)
-                tag_info = fetch_docker_hub_version(
-                    repo=repo,
-                    tag_regex=tag_regex,
-                    include_prerelease=include_prerelease,
-                    max_major=max_major,
-                )
-                if tag_info is None:
-                    logger.warning("  ⚠ No Docker Hub tag found for %s", identifier)
-                    continue
-                version = tag_info.version
-                version_str = str(tag_info.version)
-                latest_sha256 = tag_info.digest
-                logger.info(
-                    "  ✓ Latest Docker Hub tag: %s (version: %s, digest: %s)",
-                    tag_info.tag,
-                    version_str,
-                    latest_sha256 or "<missing>",
+        resolutions = self.resolve_versions()
+        grouped = self._group_targets_by_file(resolutions)
+        self._prefetch_checksums(grouped)
+        for path, jobs in grouped.items():
+            self._rewrite_file(path, jobs)
+
+    def resolve_versions(self) -> Dict[str, ResolvedDownload]:
+        """Resolve the latest version of every allowlist entry concurrently.
+
+        Lookups run on a bounded thread pool, and each registry host is further
+        limited to ``max_per_host`` in-flight requests so a large allowlist does
+        not hammer a single API.
+
+        Returns:
+            Mapping of allowlist identifiers to their resolved version. Entries
+            that could not be resolved are omitted.
+        """
+        if not self.allowlist:
+            return {}
+
+        self._prefetch_github_releases()
+
+        workers = max(1, min(self.max_workers, len(self.allowlist)))
+        logger.info("Resolving %d download(s) with %d worker(s)", len(self.allowlist), workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="downloads-resolve") as executor:
+            futures = {
+                identifier: executor.submit(self._resolve_with_host_limit, identifier, config)
+                for identifier, config in self.allowlist.items()
+            }
+            resolutions: Dict[str, ResolvedDownload] = {}
+            for identifier, future in futures.items():
+                resolved = future.result()
+                if resolved is not None:
+                    resolutions[identifier] = resolved
+        return resolutions
+
+    def _prefetch_github_releases(self) -> None:
+        """Batch every GitHub release/tag lookup into as few GraphQL calls as possible."""
+        queries = [
+            query
+            for config in self.allowlist.values()
+            if (query := _github_query(config)) is not None
+        ]
+        if queries:
+            self._github_releases = fetch_github_versions(queries)
+
+    def _resolve_with_host_limit(self, identifier: str, config: dict) -> Optional[ResolvedDownload]:
+        with self._host_slot(_source_host(config)):
+            return self._resolve(identifier, config)
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def _resolve(self, identifier: str, config: dict) -> Optional[ResolvedDownload]:
+        """Fetch version info for a single allowlist entry based on its source type."""
+        source = config.get("source", "release")
+        include_prerelease = bool(config.get("include_prerelease", False))
+        max_major = config.get("max_major")
+        latest_sha256 = None
+        logger.info(
+            "  [%s] Source: %s, Prerelease: %s, Max Major: %s",
+            identifier,
+            source,
+            include_prerelease,
+            max_major,
+        )
+
+        if source == "pypi":
+            package = config.get("package")
+            if not package:
+                logger.warning("PyPI source requires 'package' field for %s", identifier)
+                return None
+            logger.info("  [%s] Fetching PyPI package: %s", identifier, package)
+            package_info = fetch_pypi_version(
+                package=package,
+                include_prerelease=include_prerelease,
+                max_major=max_major,
+            )
+            if package_info is None:
+                logger.warning("  ⚠ No package info found for %s", identifier)
+                return None
+            version = package_info.version
+            version_str = package_info.version_str
+            logger.info("  [%s] ✓ Latest PyPI version: %s", identifier, version_str)
+        elif source == "npm":
+            package = config.get("package")
+            if not package:
+                logger.warning("npm source requires 'package' field for %s", identifier)
+                return None
+            logger.info("  [%s] Fetching npm package: %s", identifier, package)
+            package_info = fetch_npm_version(
+                package=package,
+                include_prerelease=include_prerelease,
+                max_major=max_major,
+            )
+            if package_info is None:
+                logger.warning("  ⚠ No package info found for %s", identifier)
+                return None
+            version = package_info.version
+            version_str = package_info.version_str
+            logger.info("  [%s] ✓ Latest npm version: %s", identifier, version_str)
+        elif source == "conda":
+            channel = config.get("channel", "conda-forge")
+            package = config.get("package")
+            platform = config.get("platform")
+            if not package:
+                logger.warning("Conda source requires 'package' field for %s", identifier)
+                return None
+            logger.info("  [%s] Fetching Conda package: %s/%s", identifier, channel, package)
+            package_info = fetch_conda_version(
+                channel=channel,
+                package=package,
+                platform=platform,
+                include_prerelease=include_prerelease,
+                max_major=max_major,
+            )
+            if package_info is None:
+                logger.warning("  ⚠ No package info found for %s", identifier)
+                return None
+            version = package_info.version
+            version_str = package_info.version_str
+            logger.info("  [%s] ✓ Latest Conda version: %s", identifier, version_str)
+        elif source == "custom":
+            # Handle custom version fetching (e.g., Claude Code)
+            stable_version_url = config.get("stable_version_url")
+            if not stable_version_url:
+                logger.warning("  ⚠ Custom source requires 'stable_version_url' field for %s", identifier)
+                return None
+            logger.info("  [%s] Fetching custom version from: %s", identifier, stable_version_url)
+            try:
+                response = http_session.get(stable_version_url, timeout=30)
+                response.raise_for_status()
+                version_str = response.text.strip()
+                version = self._to_version(version_str)
+                if version is None:
+                    logger.warning("  ⚠ Could not parse version from custom source: %s", version_str)
+                    return None
+                logger.info("  [%s] ✓ Latest custom version: %s", identifier, version_str)
+            except Exception as e:
+                logger.warning("  ⚠ Failed to fetch custom version for %s: %s", identifier, e)
+                return None
+        elif source == "docker_hub":
+            repo = config.get("repo")
+            tag_regex = config.get("tag_regex")
+            if not repo or not tag_regex:
+                logger.warning(
+                    "Docker Hub source requires 'repo' and 'tag_regex' fields for %s",
+                    identifier,
                 )
+                return None
+            logger.info("  [%s] Fetching Docker Hub tag from repo: %s", identifier, repo)
+            tag_info = fetch_docker_hub_version(
+                repo=repo,
+                tag_regex=tag_regex,
+                include_prerelease=include_prerelease,
+                max_major=max_major,
+            )
+            if tag_info is None:
+                logger.warning("  ⚠ No Docker Hub tag found for %s", identifier)
+                return None
+            version = tag_info.version
+            version_str = str(tag_info.version)
+            latest_sha256 = self._resolve_registry_digest(identifier, repo, tag_info.tag) or tag_info.digest
+            logger.info(
+                "  [%s] ✓ Latest Docker Hub tag: %s (version: %s, digest: %s)",
+                identifier,
+                tag_info.tag,
+                version_str,
+                latest_sha256 or "<missing>",
+            )
+        else:
+            # GitHub release or tag
+            repo = config.get("repo")
+            if not repo:
+                logger.warning("  ⚠ GitHub source requires 'repo' field for %s", identifier)
+                return None
+            logger.info("  [%s] Fetching GitHub %s from repo: %s", identifier, source, repo)
+            feature_name = config.get("feature_name")
+            if feature_name:
+                logger.info("  [%s] Filtering by feature name: %s", identifier, feature_name)
+            query = _github_query(config)
+            if query in self._github_releases:
+                release = self._github_releases[query]
             else:
-                # GitHub release or tag
-                repo = config.get("repo")
-                if not repo:
-                    logger.warning("  ⚠ GitHub source requires 'repo' field for %s", identifier)
-                    continue
-                logger.info("  Fetching GitHub %s from repo: %s", source, repo)
-                feature_name = config.get("feature_name")
-                if feature_name:
-                    logger.info("  Filtering by feature name: %s", feature_name)
                 release = fetch_github_version(
                     repo=repo,
                     source=source,
@@ -164,70 +299,151 @@ class DownloadsUpdater:
                     max_major=max_major,
                     feature_name=feature_name,
                 )
-                if release is None:
-                    logger.warning("  ⚠ No %s info found for %s (repo: %s)", source, identifier, repo)
-                    continue
-                version = release.version
-                logger.info("  ✓ Latest GitHub %s version: %s (tag: %s)", source, version, release.tag)
+            if release is None:
+                logger.warning("  ⚠ No %s info found for %s (repo: %s)", source, identifier, repo)
+                return None
+            version = release.version
+            version_str = release.tag
+            logger.info(
+                "  [%s] ✓ Latest GitHub %s version: %s (tag: %s)",
+                identifier,
+                source,
+                version,
+                release.tag,
+            )
 
-            targets = config.get("targets", [])
-            download_url_template = config.get("download_url_template")
-            manifest_url_template = config.get("manifest_url_template")
-            platform = config.get("platform")
-            logger.info("  Processing %d target(s)", len(targets))
-            for target_idx, target in enumerate(targets, 1):
+        return ResolvedDownload(version=version, version_str=version_str, sha256=latest_sha256)
+
+    @staticmethod
+    def _resolve_registry_digest(identifier: str, repo: str, tag: str) -> Optional[str]:
+        """Ask the registry itself for the tag's manifest-list digest (one HEAD request)."""
+        try:
+            digest = resolve_registry_digest(f"docker.io/{repo}", tag)
+        except OCIRegistryError as exc:
+            logger.warning("  ⚠ Registry digest lookup failed for %s, using Docker Hub listing: %s", identifier, exc)
+            return None
+        return digest.removeprefix("sha256:")
+
+    def _group_targets_by_file(
+        self,
+        resolutions: Dict[str, ResolvedDownload],
+    ) -> Dict[Path, List[_TargetJob]]:
+        """Collect every target of every resolved entry, keyed by the file it edits."""
+        grouped: Dict[Path, List[_TargetJob]] = {}
+        for identifier, config in self.allowlist.items():
+            resolved = resolutions.get(identifier)
+            if resolved is None:
+                continue
+            for target in config.get("targets", []):
                 path = self.repo_root / target["file"]
-                logger.info("  Target %d: %s", target_idx, path.relative_to(self.repo_root))
-                if not path.exists():
-                    logger.warning("    ⚠ Target file does not exist: %s", path)
+                grouped.setdefault(path, []).append(
+                    _TargetJob(identifier=identifier, config=config, resolved=resolved, target=target)
+                )
+        return grouped
+
+    def _prefetch_checksums(self, grouped: Dict[Path, List[_TargetJob]]) -> None:
+        """Compute every download-derived SHA256 the rewrite phase will ask for, in parallel."""
+        urls: List[str] = []
+        for jobs in grouped.values():
+            for job in jobs:
+                template = job.config.get("download_url_template")
+                if not job.target.get("sha256_pattern") or job.resolved.sha256 or not template:
                     continue
+                if job.config.get("manifest_url_template") and job.config.get("platform"):
+                    continue
+                version = self._format_version(job.resolved.version, job.config.get("version_format", "full"))
+                urls.append(template.format(version=version))
+        if not urls:
+            return
+        logger.info("Computing %d download checksum(s) concurrently", len(set(urls)))
+        self._checksums.update(self._checksum_cache().sha256_many(urls))
+
+    def _rewrite_file(self, path: Path, jobs: List[_TargetJob]) -> None:
+        """Apply all version and SHA256 substitutions for one file in a single pass."""
+        logger.info("\n=== Processing: %s (%d target(s)) ===", path.relative_to(self.repo_root), len(jobs))
+        if not path.exists():
+            logger.warning("    ⚠ Target file does not exist: %s", path)
+            return
 
-                # Check if this target has SHA256 tracking
-                sha256_pattern_str = target.get("sha256_pattern")
-
-                # Support multiple patterns per target
-                patterns = target.get("patterns", [target.get("pattern")])
-                if not patterns or patterns == [None]:
-                    logger.warning("    ⚠ No patterns defined for %s in %s", identifier, path)
+        text = path.read_text(encoding="utf-8")
+        edits: List[_Edit] = []
+        pending_updates: List[DownloadUpdate] = []
+
+        for job in jobs:
+            logger.info("  Target: %s", job.identifier)
+            patterns = job.target.get("patterns", [job.target.get("pattern")])
+            if not patterns or patterns == [None]:
+                logger.warning("    ⚠ No patterns defined for %s in %s", job.identifier, path)
+                continue
+            logger.info("    Checking %d pattern(s)", len(patterns))
+
+            version_format = job.config.get("version_format", "full")  # full, major_only, major_minor
+            formatted_version = self._format_version(job.resolved.version, version_format)
+            for pattern_idx, pattern_str in enumerate(patterns, 1):
+                logger.info("    Pattern %d: %s", pattern_idx, pattern_str[:80] + "..." if len(pattern_str) > 80 else pattern_str)
+                pattern = re.compile(pattern_str, re.MULTILINE)
+                pattern_edits, previous = self._collect_version_edits(
+                    text,
+                    pattern,
+                    job.resolved.version,
+                    version_format,
+                )
+                if not pattern_edits:
                     continue
-                logger.info("    Checking %d pattern(s)", len(patterns))
+                assert previous is not None
+                edits.extend(pattern_edits)
+                pending_updates.append(
+                    DownloadUpdate(
+                        file=path,
+                        identifier=job.identifier,
+                        previous=previous,
+                        updated=formatted_version,
+                    )
+                )
+
+            sha256_edit = self._collect_sha256_edit(text, job, formatted_version)
+            if sha256_edit is not None:
+                edits.append(sha256_edit)
+
+        new_text = _apply_edits(text, edits, path)
+        if new_text == text:
+            return
 
-                for pattern_idx, pattern_str in enumerate(patterns, 1):
-                    logger.info("    Pattern %d: %s", pattern_idx, pattern_str[:80] + "..." if len(pattern_str) > 80 else pattern_str)
-                    pattern = re.compile(pattern_str, re.MULTILINE)
-                    self._update_file(path, pattern, identifier, version, version_format,
-                                    sha256_pattern_str, download_url_template, manifest_url_template, platform,
-                                    latest_sha256)
+        _atomic_write_text(path, new_text)
+        for update in pending_updates:
+            logger.info(
+                "Updated %s in %s (previous: %s, new: %s)",
+                update.identifier,
+                path,
+                update.previous,
+                update.updated,
+            )
+            self.report.add_download_update(update)
 
-    def _update_file(
+    def _collect_version_edits(
         self,
-        path: Path,
+        text: str,
         pattern: re.Pattern[str],
-        identifier: str,
         latest_version: Version,
         version_format: str = "full",
-        sha256_pattern_str: Optional[str] = None,
-        download_url_template: Optional[str] = None,
-        manifest_url_template: Optional[str] = None,
-        platform: Optional[str] = None,
-        latest_sha256: Optional[str] = None,
-    ) -> None:
-        """Update all occurrences of a version pattern in a file, and optionally update SHA256."""
-        text = path.read_text(encoding="utf-8")
+    ) -> tuple[List[_Edit], Optional[str]]:
+        """Find outdated occurrences of a version pattern.
 
-        # Find all matches
+        Returns:
+            The span edits replacing each outdated ``version`` group, and the
+            previous version to report (the last occurrence in the file).
+        """
         matches = list(pattern.finditer(text))
         if not matches:
             logger.info("      ℹ Pattern not found in file (no matches)")
-            return
+            return [], None
         logger.info("      Found %d match(es) in file", len(matches))
 
-        updates_made = 0
-        new_text = text
+        edits: List[_Edit] = []
         first_old_version = None
-        last_new_version = None
+        formatted_version = self._format_version(latest_version, version_format)
 
-        # Process matches in reverse order to preserve offsets
+        # Walk matches in reverse so the reported previous version matches prior behavior
         for match_idx, match in enumerate(reversed(matches), 1):
             current_version = match.group("version")
             logger.info("      Match %d: current version = %s", match_idx, current_version)
@@ -238,9 +454,6 @@ class DownloadsUpdater:
                 continue
             logger.info("      Parsed as: %s", maybe_version)
 
-            # Format the new version according to version_format
-            formatted_version = self._format_version(latest_version, version_format)
-
             # For comparison, use the appropriate version parts
             if version_format == "major_only":
                 # Compare major versions only
@@ -266,112 +479,84 @@ class DownloadsUpdater:
                 logger.info("      🔄 Update available: %s -> %s (full)",
                            current_version, formatted_version)
 
-            # Track first old version encountered (last in file due to reverse order)
             if first_old_version is None:
                 first_old_version = current_version
 
-            # Replace this specific occurrence
-            start, end = match.span()
-            old_match = new_text[start:end]
-            new_match = old_match.replace(current_version, formatted_version)
-            new_text = new_text[:start] + new_match + new_text[end:]
-            last_new_version = formatted_version
-            updates_made += 1
-
-        if updates_made > 0:
-            assert first_old_version is not None and last_new_version is not None
-            path.write_text(new_text, encoding="utf-8")
-            logger.info(
-                "Updated %s occurrences of %s in %s (previous: %s, new: %s)",
-                updates_made,
-                identifier,
-                path,
-                first_old_version,
-                last_new_version,
-            )
-            self.report.add_download_update(
-                DownloadUpdate(
-                    file=path,
-                    identifier=identifier,
-                    previous=first_old_version,
-                    updated=last_new_version,
-                )
-            )
+            start, end = match.span("version")
+            edits.append(_Edit(start=start, end=end, replacement=formatted_version))
 
-            # If SHA256 pattern is provided, update the checksum too
-            if sha256_pattern_str and (latest_sha256 or download_url_template or manifest_url_template):
-                logger.info("      🔐 Updating SHA256 checksum...")
-                self._update_sha256(path, sha256_pattern_str, formatted_version,
-                                    download_url_template, manifest_url_template, platform, latest_sha256)
-        elif sha256_pattern_str and (latest_sha256 or download_url_template or manifest_url_template):
-            logger.info("      🔐 Checking SHA256 checksum without version change...")
-            self._update_sha256(path, sha256_pattern_str, self._format_version(latest_version, version_format),
-                                download_url_template, manifest_url_template, platform, latest_sha256)
-
-    def _update_sha256(
-        self,
-        path: Path,
-        sha256_pattern_str: str,
-        version: str,
-        download_url_template: Optional[str] = None,
-        manifest_url_template: Optional[str] = None,
-        platform: Optional[str] = None,
-        new_sha256: Optional[str] = None,
-    ) -> None:
-        """Update SHA256 checksum for a given version."""
-        # Determine if we need to fetch from manifest or compute from download
-        if new_sha256:
-            pass
-        elif manifest_url_template and platform:
-            # Fetch SHA256 from manifest (e.g., Claude Code)
-            manifest_url = manifest_url_template.format(version=version)
-            new_sha256 = self._fetch_sha256_from_manifest(manifest_url, platform)
-        elif download_url_template:
-            # Compute SHA256 by downloading the file
-            download_url = download_url_template.format(version=version)
-            new_sha256 = self._compute_sha256_from_url(download_url)
-        else:
-            logger.warning("      ⚠ No download_url_template or manifest_url_template provided")
-            return
+        return edits, first_old_version
 
-        if not new_sha256:
-            logger.warning("      ⚠ Could not compute SHA256, skipping checksum update")
-            return
-        new_sha256 = new_sha256.removeprefix("sha256:")
+    def _collect_sha256_edit(self, text: str, job: _TargetJob, version: str) -> Optional[_Edit]:
+        """Build the checksum edit for a target, if it tracks one and it changed."""
+        sha256_pattern_str = job.target.get("sha256_pattern")
+        download_url_template = job.config.get("download_url_template")
+        manifest_url_template = job.config.get("manifest_url_template")
+        if not sha256_pattern_str or not (
+            job.resolved.sha256 or download_url_template or manifest_url_template
+        ):
+            return None
 
-        # Update SHA256 in file
-        text = path.read_text(encoding="utf-8")
         sha256_pattern = re.compile(sha256_pattern_str, re.MULTILINE)
         matches = list(sha256_pattern.finditer(text))
-
         if not matches:
             logger.warning("      ⚠ SHA256 pattern not found in file")
-            return
+            return None
+
+        logger.info("      🔐 Checking SHA256 checksum for %s...", version)
+        new_sha256 = self._resolve_sha256(
+            version,
+            download_url_template,
+            manifest_url_template,
+            job.config.get("platform"),
+            job.resolved.sha256,
+        )
+        if not new_sha256:
+            logger.warning("      ⚠ Could not compute SHA256, skipping checksum update")
+            return None
+        new_sha256 = new_sha256.removeprefix("sha256:")
 
         if len(matches) > 1:
             logger.warning("      ⚠ Multiple SHA256 matches found, updating first occurrence only")
 
         match = matches[0]
         old_sha256 = match.group("sha256")
-
         if old_sha256 == new_sha256:
             logger.info("      ✓ SHA256 already up to date: %s", new_sha256[:16] + "...")
-            return
+            return None
+
+        logger.info("      🔄 SHA256 update: %s... -> %s...", old_sha256[:16], new_sha256[:16])
+        start, end = match.span("sha256")
+        return _Edit(start=start, end=end, replacement=new_sha256)
 
-        # Replace the SHA256
-        start, end = match.span()
-        old_match = text[start:end]
-        new_match = old_match.replace(old_sha256, new_sha256)
-        new_text = text[:start] + new_match + text[end:]
-        path.write_text(new_text, encoding="utf-8")
-        logger.info("      ✅ Updated SHA256: %s... -> %s...", old_sha256[:16], new_sha256[:16])
+    def _resolve_sha256(
+        self,
+        version: str,
+        download_url_template: Optional[str] = None,
+        manifest_url_template: Optional[str] = None,
+        platform: Optional[str] = None,
+        new_sha256: Optional[str] = None,
+    ) -> Optional[str]:
+        """Determine the expected SHA256 checksum for a given version."""
+        if new_sha256:
+            return new_sha256
+        if manifest_url_template and platform:
+            # Fetch SHA256 from manifest (e.g., Claude Code)
+            manifest_url = manifest_url_template.format(version=version)
+            return self._fetch_sha256_from_manifest(manifest_url, platform)
+        if download_url_template:
+            # Compute SHA256 by downloading the file
+            download_url = download_url_template.format(version=version)
+            return self._compute_sha256_from_url(download_url)
+        logger.warning("      ⚠ No download_url_template or manifest_url_template provided")
+        return None
 
     @staticmethod
     def _fetch_sha256_from_manifest(manifest_url: str, platform: str) -> Optional[str]:
         """Fetch SHA256 checksum from a manifest JSON file."""
         try:
             logger.info("      📥 Fetching manifest: %s", manifest_url)
-            response = requests.get(manifest_url, timeout=30)
+            response = http_session.get(manifest_url, timeout=30)
             response.raise_for_status()
             manifest = response.json()
             platforms = manifest.get("platforms", {})
@@ -401,27 +586,74 @@ class DownloadsUpdater:
     @staticmethod
     def _to_version(raw: str) -> Optional[Version]:
         """Parse version string, handling common prefixes."""
-        cleaned = raw.lstrip("vV")
-        try:
-            return Version(cleaned)
-        except InvalidVersion:
-            return None
-
-    @staticmethod
-    def _compute_sha256_from_url(url: str) -> Optional[str]:
-        """Download a file and compute its SHA256 checksum."""
-        try:
-            logger.info("      📥 Downloading to compute SHA256: %s", url)
-            response = requests.get(url, timeout=60, stream=True)
-            response.raise_for_status()
-
-            sha256_hash = hashlib.sha256()
-            for chunk in response.iter_content(chunk_size=8192):
-                sha256_hash.update(chunk)
-
-            checksum = sha256_hash.hexdigest()
-            logger.info("      ✓ Computed SHA256: %s", checksum)
-            return checksum
-        except Exception as e:
-            logger.warning("      ⚠ Failed to compute SHA256 from %s: %s", url, e)
-            return None
+        return parse_version(raw.lstrip("vV"))
+
+    def _compute_sha256_from_url(self, url: str) -> Optional[str]:
+        """Return the SHA256 of a download, reusing prefetched or cached checksums."""
+        if url in self._checksums:
+            return self._checksums[url]
+        checksum = self._checksum_cache().sha256(url)
+        self._checksums[url] = checksum
+        return checksum
+
+    def _checksum_cache(self) -> ChecksumCache:
+        if self.checksum_cache is None:
+            self.checksum_cache = default_checksum_cache()
+        return self.checksum_cache
+
+
+def _github_query(config: dict) -> Optional[ReleaseQuery]:
+    source = config.get("source", "release")
+    repo = config.get("repo")
+    if source not in {"release", "tag"} or not repo:
+        return None
+    return ReleaseQuery(
+        repo=repo,
+        source=source,
+        include_prerelease=bool(config.get("include_prerelease", False)),
+        max_major=config.get("max_major"),
+        feature_name=config.get("feature_name"),
+    )
+
+
+def _source_host(config: dict) -> str:
+    """Return the registry host an allowlist entry resolves against."""
+    source = config.get("source", "release")
+    if source == "custom":
+        return urlparse(config.get("stable_version_url") or "").netloc or "custom"
+    return urlparse(_SOURCE_API_ROOTS.get(source, GITHUB_API_ROOT)).netloc
+
+
+def _apply_edits(text: str, edits: List[_Edit], path: Path) -> str:
+    """Splice span edits into ``text`` in one pass, dropping overlapping edits."""
+    if not edits:
+        return text
+
+    pieces: List[str] = []
+    cursor = 0
+    for edit in sorted(edits, key=lambda item: (item.start, item.end)):
+        if edit.start < cursor:
+            logger.warning(
+                "      ⚠ Skipping overlapping edit at offset %d in %s",
+                edit.start,
+                path,
+            )
+            continue
+        pieces.append(text[cursor:edit.start])
+        pieces.append(edit.replacement)
+        cursor = edit.end
+    pieces.append(text[cursor:])
+    return "".join(pieces)
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` via a sibling temp file and an atomic rename."""
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as stream:
+            stream.write(text)
+        shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -6,12 +6,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Set
 
-from packaging.version import InvalidVersion, Version
+from packaging.version import Version
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
-from .github_api import ReleaseInfo, fetch_latest_version
+from .github_api import ReleaseInfo, ReleaseQuery, fetch_latest_version, fetch_latest_versions
 from .reporter import GitHubActionUpdate, MaintenanceReport
+from .versions import parse_version
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,7 @@ class GitHubActionsUpdater:
 
     def update_workflows(self, workflows_dir: Path) -> Set[str]:
         updated_files: Set[str] = set()
+        self.prefetch_releases(self.allowlist)
         candidates = list(self._iter_workflow_files(workflows_dir))
         for path in candidates:
             if self._update_workflow(path):
@@ -173,6 +175,36 @@ class GitHubActionsUpdater:
         )
         return UpdateResult(value=new_value, comment=version_comment)
 
+    def prefetch_releases(self, actions: Iterable[str]) -> None:
+        """Resolve releases for many allowlisted actions in one batched lookup."""
+        queries: Dict[str, ReleaseQuery] = {}
+        for action in actions:
+            if action in self._release_cache:
+                continue
+            query = self._release_query(action)
+            if query is not None:
+                queries[action] = query
+        if not queries:
+            return
+
+        logger.info("Resolving releases for %d action(s) in batch", len(queries))
+        releases = fetch_latest_versions(queries.values())
+        for action, query in queries.items():
+            self._release_cache[action] = releases.get(query)
+
+    def _release_query(self, action: str) -> Optional[ReleaseQuery]:
+        config = self.allowlist.get(action, {})
+        repo = config.get("repo")
+        if not repo:
+            return None
+        return ReleaseQuery(
+            repo=repo,
+            source=config.get("source", "release"),
+            include_prerelease=bool(config.get("include_prerelease", False)),
+            max_major=config.get("max_major"),
+            pin_to_sha=config.get("pin_to_sha", True),
+        )
+
     def _get_release(self, action: str) -> Optional[ReleaseInfo]:
         if action not in self._release_cache:
             config = self.allowlist.get(action, {})
@@ -197,7 +229,4 @@ class GitHubActionsUpdater:
             trimmed = trimmed[len("refs/tags/"):]
         if trimmed.startswith("v"):
             trimmed = trimmed[1:]
-        try:
-            return Version(trimmed)
-        except InvalidVersion:
-            return None
+        return parse_version(trimmed)
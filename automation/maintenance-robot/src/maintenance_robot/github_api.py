@@ -4,16 +4,25 @@ import logging
 import os
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, Iterable, Iterator, Optional
 
 import requests
 from dotenv import find_dotenv, load_dotenv
-from packaging.version import InvalidVersion, Version
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from packaging.version import Version
+from requests.utils import parse_header_links
+
+from . import http_session
+from .http_cache import cached_get
+from .http_session import api_retry
+from .versions import parse_version
 
 logger = logging.getLogger(__name__)
 
 GITHUB_API_ROOT = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_ROOT}/graphql"
+GRAPHQL_BATCH_SIZE = 20
+DEFAULT_MAX_PAGES = 3
+FEATURE_TAG_MAX_PAGES = 20
 
 
 class GitHubAPIError(RuntimeError):
@@ -27,6 +36,18 @@ class ReleaseInfo:
     sha: Optional[str] = None  # Commit SHA for pinning
 
 
+@dataclass(frozen=True)
+class ReleaseQuery:
+    """Arguments for one ``fetch_latest_version`` lookup, hashable for batching."""
+
+    repo: str
+    source: str = "release"
+    include_prerelease: bool = False
+    max_major: Optional[int] = None
+    feature_name: Optional[str] = None
+    pin_to_sha: bool = True
+
+
 @lru_cache(maxsize=1)
 def _github_token() -> Optional[str]:
     load_dotenv(find_dotenv(usecwd=True), override=False)
@@ -44,44 +65,50 @@ def _headers() -> dict[str, str]:
     return headers
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=8),
-    stop=stop_after_attempt(4),
-    retry=retry_if_exception_type((requests.RequestException, GitHubAPIError)),
-)
-def _get(url: str, per_page: int = 100, max_pages: int = 3) -> list[dict]:
-    """Fetch paginated results from GitHub API.
+def _iter_pages(url: str, per_page: int = 100, max_pages: int = 3) -> Iterator[dict]:
+    """Lazily yield entries from a paginated GitHub API listing.
+
+    Pages are requested only as the caller consumes entries, and subsequent
+    pages are located through the ``Link: rel="next"`` header rather than by
+    guessing page numbers, so callers that stop early never fetch the rest.
 
     Args:
         url: API endpoint URL
         per_page: Results per page (max 100)
         max_pages: Maximum number of pages to fetch
-
-    Returns:
-        Aggregated list of results from all pages
     """
-    all_results = []
-    page = 1
-
-    while page <= max_pages:
-        paginated_url = f"{url}{'&' if '?' in url else '?'}per_page={per_page}&page={page}"
-        response = requests.get(paginated_url, headers=_headers(), timeout=30)
-        if response.status_code >= 400:
-            raise GitHubAPIError(f"GitHub API error {response.status_code}: {response.text}")
-        try:
-            data = response.json()
-        except ValueError as exc:
-            raise GitHubAPIError("Failed to decode JSON from GitHub API") from exc
-        if not isinstance(data, list):
-            raise GitHubAPIError("Expected list response from GitHub API")
+    next_url: Optional[str] = f"{url}{'&' if '?' in url else '?'}per_page={per_page}"
+    pages = 0
 
+    while next_url and pages < max_pages:
+        data, next_url = _fetch_page(next_url)
+        pages += 1
         if not data:  # No more results
-            break
+            return
+        yield from data
 
-        all_results.extend(data)
-        page += 1
 
-    return all_results
+@api_retry(GitHubAPIError)
+def _fetch_page(url: str) -> tuple[list[dict], Optional[str]]:
+    response = cached_get(url, headers=_headers(), timeout=30)
+    if response.status_code >= 400:
+        raise GitHubAPIError(f"GitHub API error {response.status_code}: {response.text}")
+    try:
+        data = response.json()
+    except ValueError as exc:
+        raise GitHubAPIError("Failed to decode JSON from GitHub API") from exc
+    if not isinstance(data, list):
+        raise GitHubAPIError("Expected list response from GitHub API")
+    return data, _next_page_url(response.headers.get("Link"))
+
+
+def _next_page_url(link_header: Optional[str]) -> Optional[str]:
+    if not link_header:
+        return None
+    for link in parse_header_links(link_header):
+        if link.get("rel") == "next":
+            return link.get("url")
+    return None
 
 
 def _normalize_tag(tag: str, sha: Optional[str] = None) -> Optional[ReleaseInfo]:
@@ -90,11 +117,9 @@ def _normalize_tag(tag: str, sha: Optional[str] = None) -> Optional[ReleaseInfo]
     normalized = tag.strip()
     if normalized.startswith("refs/tags/"):
         normalized = normalized[len("refs/tags/"):]
-    try:
-        version = Version(normalized.lstrip("v"))
+    version = parse_version(normalized.lstrip("v"))
+    if version is not None:
         return ReleaseInfo(tag=normalized, version=version, sha=sha)
-    except InvalidVersion:
-        pass
 
     # DevContainer features use tag format: feature_<name>_<version>
     if normalized.startswith("feature_"):
@@ -102,23 +127,21 @@ def _normalize_tag(tag: str, sha: Optional[str] = None) -> Optional[ReleaseInfo]
         if "_" in remainder:
             _, _, version_part = remainder.rpartition("_")
             if version_part:
-                try:
-                    version = Version(version_part.lstrip("v"))
-                    return ReleaseInfo(tag=normalized, version=version, sha=sha)
-                except InvalidVersion:
+                version = parse_version(version_part.lstrip("v"))
+                if version is None:
                     logger.debug("Skipping invalid feature tag: %s", normalized)
                     return None
+                return ReleaseInfo(tag=normalized, version=version, sha=sha)
 
     # Sema4.ai action-server uses tag format: sema4ai-action_server-<version>
     if "sema4ai-action_server-" in normalized:
         _, _, version_part = normalized.rpartition("sema4ai-action_server-")
         if version_part:
-            try:
-                version = Version(version_part.lstrip("v"))
-                return ReleaseInfo(tag=normalized, version=version, sha=sha)
-            except InvalidVersion:
+            version = parse_version(version_part.lstrip("v"))
+            if version is None:
                 logger.debug("Skipping invalid action-server tag: %s", normalized)
                 return None
+            return ReleaseInfo(tag=normalized, version=version, sha=sha)
 
     logger.debug("Skipping invalid semantic version tag: %s", normalized)
     return None
@@ -137,7 +160,7 @@ def _get_tag_sha(repo: str, tag: str) -> Optional[str]:
     # First try refs/tags endpoint
     url = f"{GITHUB_API_ROOT}/repos/{repo}/git/refs/tags/{tag}"
     try:
-        response = requests.get(url, headers=_headers(), timeout=30)
+        response = cached_get(url, headers=_headers(), timeout=30)
         if response.status_code == 200:
             data = response.json()
             obj = data.get("object", {})
@@ -146,7 +169,7 @@ def _get_tag_sha(repo: str, tag: str) -> Optional[str]:
                 # Annotated tag - need to fetch the tag object to get commit SHA
                 tag_url = obj.get("url")
                 if tag_url:
-                    tag_response = requests.get(tag_url, headers=_headers(), timeout=30)
+                    tag_response = cached_get(tag_url, headers=_headers(), timeout=30)
                     if tag_response.status_code == 200:
                         tag_data = tag_response.json()
                         commit_obj = tag_data.get("object", {})
@@ -183,8 +206,35 @@ def fetch_latest_version(
         raise ValueError(f"Unsupported source type: {source}")
 
     url = f"{GITHUB_API_ROOT}/repos/{repo}/{'releases' if source == 'release' else 'tags'}"
-    entries = _get(url)
+    # Feature tags are interleaved across every feature in the repo, so keep
+    # streaming pages until the requested feature shows up.
+    max_pages = FEATURE_TAG_MAX_PAGES if feature_name and repo == "devcontainers/features" else DEFAULT_MAX_PAGES
+    return _select_release(
+        repo,
+        source,
+        _iter_pages(url, max_pages=max_pages),
+        include_prerelease=include_prerelease,
+        max_major=max_major,
+        feature_name=feature_name,
+        pin_to_sha=pin_to_sha,
+    )
+
+
+def _select_release(
+    repo: str,
+    source: str,
+    entries: Iterable[dict],
+    include_prerelease: bool = False,
+    max_major: Optional[int] = None,
+    feature_name: Optional[str] = None,
+    pin_to_sha: bool = True,
+) -> Optional[ReleaseInfo]:
+    """Return the first release/tag entry satisfying the constraints.
 
+    Entries use the REST payload shape. GraphQL results are converted to that
+    shape and may carry a ``peeled_sha`` for releases so no extra tag lookup is
+    needed.
+    """
     for entry in entries:
         tag_name = entry.get("tag_name") if source == "release" else entry.get("name")
 
@@ -198,6 +248,8 @@ def fetch_latest_version(
         if source == "tag":
             commit_info = entry.get("commit", {})
             sha = commit_info.get("sha")
+        elif pin_to_sha:
+            sha = entry.get("peeled_sha")
 
         release_info = _normalize_tag(tag_name or "", sha=sha)
         if release_info is None:
@@ -230,3 +282,122 @@ def fetch_latest_version(
         return release_info
 
     return None
+
+
+def fetch_latest_versions(queries: Iterable[ReleaseQuery]) -> Dict[ReleaseQuery, Optional[ReleaseInfo]]:
+    """Resolve many repositories at once, batching through the GraphQL API.
+
+    Each GraphQL request covers up to ``GRAPHQL_BATCH_SIZE`` repositories and
+    returns the latest releases (with their peeled commit SHA) or tags in one
+    round-trip. GraphQL requires a token; without one, or for any query the
+    batch could not answer, the REST path in ``fetch_latest_version`` is used.
+    """
+    unique = list(dict.fromkeys(queries))
+    results: Dict[ReleaseQuery, Optional[ReleaseInfo]] = {}
+
+    if unique and _github_token():
+        for offset in range(0, len(unique), GRAPHQL_BATCH_SIZE):
+            batch = unique[offset:offset + GRAPHQL_BATCH_SIZE]
+            try:
+                results.update(_graphql_resolve(batch))
+            except (requests.RequestException, GitHubAPIError) as exc:
+                logger.warning("GitHub GraphQL batch failed, falling back to REST: %s", exc)
+
+    for query in unique:
+        if results.get(query) is None:
+            results[query] = fetch_latest_version(
+                repo=query.repo,
+                source=query.source,
+                include_prerelease=query.include_prerelease,
+                max_major=query.max_major,
+                feature_name=query.feature_name,
+                pin_to_sha=query.pin_to_sha,
+            )
+    return results
+
+
+_GRAPHQL_RELEASES = (
+    "releases(first: 100, orderBy: {field: CREATED_AT, direction: DESC}) "
+    "{ nodes { tagName isPrerelease isDraft tagCommit { oid } } }"
+)
+_GRAPHQL_TAGS = (
+    'refs(refPrefix: "refs/tags/", first: 100, query: $%s, '
+    "orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) "
+    "{ nodes { name target { __typename oid ... on Tag { target { oid } } } } }"
+)
+
+
+def _graphql_resolve(batch: list[ReleaseQuery]) -> Dict[ReleaseQuery, Optional[ReleaseInfo]]:
+    variables: Dict[str, str] = {}
+    declarations: list[str] = []
+    fields: list[str] = []
+    for index, query in enumerate(batch):
+        if query.source not in {"release", "tag"}:
+            raise ValueError(f"Unsupported source type: {query.source}")
+        owner, _, name = query.repo.partition("/")
+        variables[f"owner{index}"] = owner
+        variables[f"name{index}"] = name
+        declarations.extend([f"$owner{index}: String!", f"$name{index}: String!"])
+        if query.source == "release":
+            selection = _GRAPHQL_RELEASES
+        else:
+            feature_filter = query.feature_name and query.repo == "devcontainers/features"
+            variables[f"query{index}"] = f"feature_{query.feature_name}_" if feature_filter else ""
+            declarations.append(f"$query{index}: String")
+            selection = _GRAPHQL_TAGS % f"query{index}"
+        fields.append(f"r{index}: repository(owner: $owner{index}, name: $name{index}) {{ {selection} }}")
+
+    document = f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+    response = http_session.post(
+        GITHUB_GRAPHQL_URL,
+        json={"query": document, "variables": variables},
+        headers=_headers(),
+    )
+    if response.status_code >= 400:
+        raise GitHubAPIError(f"GitHub GraphQL error {response.status_code}: {response.text}")
+    try:
+        payload = response.json()
+    except ValueError as exc:
+        raise GitHubAPIError("Failed to decode JSON from GitHub GraphQL API") from exc
+
+    data = payload.get("data") or {}
+    for error in payload.get("errors") or []:
+        logger.debug("GitHub GraphQL partial error: %s", error.get("message", error))
+
+    results: Dict[ReleaseQuery, Optional[ReleaseInfo]] = {}
+    for index, query in enumerate(batch):
+        repository = data.get(f"r{index}")
+        if not repository:
+            continue
+        if query.source == "release":
+            entries = [
+                {
+                    "tag_name": node.get("tagName"),
+                    "prerelease": node.get("isPrerelease"),
+                    "draft": node.get("isDraft"),
+                    "peeled_sha": (node.get("tagCommit") or {}).get("oid"),
+                }
+                for node in (repository.get("releases") or {}).get("nodes", [])
+            ]
+        else:
+            entries = [
+                {"name": node.get("name"), "commit": {"sha": _peeled_oid(node.get("target") or {})}}
+                for node in (repository.get("refs") or {}).get("nodes", [])
+            ]
+        results[query] = _select_release(
+            query.repo,
+            query.source,
+            entries,
+            include_prerelease=query.include_prerelease,
+            max_major=query.max_major,
+            feature_name=query.feature_name,
+            pin_to_sha=query.pin_to_sha,
+        )
+    return results
+
+
+def _peeled_oid(target: dict) -> Optional[str]:
+    # Annotated tags point at a Tag object; lightweight tags point at the commit directly.
+    if target.get("__typename") == "Tag":
+        return (target.get("target") or {}).get("oid")
+    return target.get("oid")
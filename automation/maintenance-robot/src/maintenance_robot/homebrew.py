@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import logging
-import requests
 from typing import Dict, Optional
 
+import requests
+
+from . import http_session
+from .homebrew_index import HomebrewIndex, HomebrewIndexError
 from .reporter import MaintenanceReport
 
 logger = logging.getLogger(__name__)
@@ -12,9 +15,17 @@ logger = logging.getLogger(__name__)
 class HomebrewUpdater:
     """Updates Homebrew formula and cask versions by querying the Homebrew API."""
 
-    def __init__(self, allowlist: Dict[str, dict], report: MaintenanceReport) -> None:
+    def __init__(
+        self,
+        allowlist: Dict[str, dict],
+        report: MaintenanceReport,
+        use_bulk_index: bool = False,
+        index: Optional[HomebrewIndex] = None,
+    ) -> None:
         self.allowlist = allowlist
         self.report = report
+        self.use_bulk_index = use_bulk_index or index is not None
+        self._index = index
         self._version_cache: Dict[str, Optional[str]] = {}
 
     def update_formulas(self) -> Dict[str, Optional[str]]:
@@ -71,11 +82,19 @@ class HomebrewUpdater:
         if cache_key in self._version_cache:
             return self._version_cache[cache_key]
 
+        index = self._bulk_index()
+        if index is not None:
+            version = index.version(name, pkg_type)
+            if version:
+                self._version_cache[cache_key] = version
+                return version
+            logger.debug("%s %s not in bulk Homebrew index; querying API directly", pkg_type, name)
+
         url = f"https://formulae.brew.sh/api/{pkg_type}/{name}.json"
 
         try:
             logger.debug("Fetching: %s", url)
-            response = requests.get(url, timeout=30)
+            response = http_session.get(url, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -101,3 +120,16 @@ class HomebrewUpdater:
             logger.error("Failed to parse Homebrew API response for %s: %s", name, e)
             self._version_cache[cache_key] = None
             return None
+
+    def _bulk_index(self) -> Optional[HomebrewIndex]:
+        """Load the bulk formula/cask index once when bulk mode is enabled."""
+        if not self.use_bulk_index:
+            return None
+        if self._index is None:
+            try:
+                self._index = HomebrewIndex.load()
+            except (requests.RequestException, HomebrewIndexError) as e:
+                logger.warning("Failed to load bulk Homebrew index, using per-name API: %s", e)
+                self.use_bulk_index = False
+                return None
+        return self._index
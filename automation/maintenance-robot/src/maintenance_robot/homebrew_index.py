@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .http_cache import cached_get
+
+logger = logging.getLogger(__name__)
+
+HOMEBREW_API_ROOT = "https://formulae.brew.sh/api"
+CORE_TAP = "homebrew/core"
+CASK_TAP = "homebrew/cask"
+
+
+class HomebrewIndexError(RuntimeError):
+    """Raised when the bulk Homebrew API index cannot be fetched or parsed."""
+
+
+class HomebrewIndex:
+    """In-memory name -> version index built from the bulk Homebrew API payloads.
+
+    Only the fields needed for lookups are kept: the canonical name, its stable
+    version, and every alternate spelling (full name, aliases, old names or old
+    cask tokens) mapped back to the canonical name. Every lookup is then a dict
+    hit instead of an API request.
+    """
+
+    def __init__(
+        self,
+        formula_versions: Dict[str, Optional[str]],
+        formula_names: Dict[str, str],
+        cask_versions: Dict[str, Optional[str]],
+        cask_names: Dict[str, str],
+    ) -> None:
+        self._versions = {"formula": formula_versions, "cask": cask_versions}
+        self._names = {"formula": formula_names, "cask": cask_names}
+
+    @classmethod
+    def load(cls) -> "HomebrewIndex":
+        """Download (or revalidate from the HTTP cache) the bulk formula and cask indexes."""
+        started = time.perf_counter()
+        formulae = _fetch_payload(f"{HOMEBREW_API_ROOT}/formula.json")
+        casks = _fetch_payload(f"{HOMEBREW_API_ROOT}/cask.json")
+        index = cls.from_payloads(formulae, casks)
+        logger.info(
+            "Loaded Homebrew index: %d formulae, %d casks (~%.1f MiB in memory) in %.2fs",
+            len(index._versions["formula"]),
+            len(index._versions["cask"]),
+            index.approximate_size() / (1024 * 1024),
+            time.perf_counter() - started,
+        )
+        return index
+
+    @classmethod
+    def from_payloads(cls, formulae: Iterable[dict], casks: Iterable[dict]) -> "HomebrewIndex":
+        formula_versions: Dict[str, Optional[str]] = {}
+        formula_names: Dict[str, str] = {}
+        for entry in formulae:
+            name = entry.get("name")
+            if not name:
+                continue
+            name = sys.intern(name)
+            formula_versions[name] = (entry.get("versions") or {}).get("stable")
+            aliases = [entry.get("full_name"), *(entry.get("aliases") or []), *(entry.get("oldnames") or [])]
+            if entry.get("oldname"):
+                aliases.append(entry["oldname"])
+            _register_names(formula_names, name, aliases, CORE_TAP)
+
+        cask_versions: Dict[str, Optional[str]] = {}
+        cask_names: Dict[str, str] = {}
+        for entry in casks:
+            token = entry.get("token")
+            if not token:
+                continue
+            token = sys.intern(token)
+            cask_versions[token] = entry.get("version")
+            aliases = [entry.get("full_token"), *(entry.get("old_tokens") or [])]
+            _register_names(cask_names, token, aliases, CASK_TAP)
+
+        return cls(formula_versions, formula_names, cask_versions, cask_names)
+
+    def resolve(self, name: str, pkg_type: str = "formula") -> Optional[str]:
+        """Return the canonical name for a formula/cask name, alias or old name."""
+        versions = self._versions.get(pkg_type, {})
+        if name in versions:
+            return name
+        return self._names.get(pkg_type, {}).get(name)
+
+    def contains(self, name: str, pkg_type: str = "formula") -> bool:
+        return self.resolve(name, pkg_type) is not None
+
+    def version(self, name: str, pkg_type: str = "formula") -> Optional[str]:
+        canonical = self.resolve(name, pkg_type)
+        if canonical is None:
+            return None
+        return self._versions[pkg_type][canonical]
+
+    def approximate_size(self) -> int:
+        """Rough in-memory footprint of the index in bytes (containers, keys and values)."""
+        total = 0
+        seen: set[int] = set()
+        for mapping in (*self._versions.values(), *self._names.values()):
+            total += sys.getsizeof(mapping)
+            for key, value in mapping.items():
+                for item in (key, value):
+                    if item is not None and id(item) not in seen:
+                        seen.add(id(item))
+                        total += sys.getsizeof(item)
+        return total
+
+
+def _register_names(names: Dict[str, str], canonical: str, aliases: Iterable[Optional[str]], tap: str) -> None:
+    names[f"{tap}/{canonical}"] = canonical
+    for alias in aliases:
+        if alias and alias != canonical:
+            names[sys.intern(alias)] = canonical
+
+
+def _fetch_payload(url: str) -> List[dict]:
+    response = cached_get(url, timeout=120)
+    if response.status_code >= 400:
+        raise HomebrewIndexError(f"Homebrew API error {response.status_code} for {url}")
+    try:
+        data = response.json()
+    except ValueError as exc:
+        raise HomebrewIndexError(f"Failed to decode JSON from {url}") from exc
+    if not isinstance(data, list):
+        raise HomebrewIndexError(f"Expected list response from {url}")
+    logger.debug("Fetched %s (%d entries, from cache: %s)", url, len(data), response.from_cache)
+    return data
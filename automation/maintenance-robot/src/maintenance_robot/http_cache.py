@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from requests.structures import CaseInsensitiveDict
+
+from . import http_session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _default_cache_dir() -> Path:
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "room-of-requirement" / "maintenance-robot" / "http"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Minimal response view shared by fresh and revalidated cache hits."""
+
+    url: str
+    status_code: int
+    text: str
+    headers: CaseInsensitiveDict = field(default_factory=CaseInsensitiveDict)
+    from_cache: bool = False
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class HTTPCache:
+    """On-disk response cache keyed by URL that revalidates with ETag/Last-Modified.
+
+    Successful responses carrying a validator are stored as one JSON file per
+    URL. Later requests send ``If-None-Match``/``If-Modified-Since`` and reuse
+    the stored body on ``304 Not Modified``. The least recently used entries are
+    evicted once the cache exceeds ``max_entries`` files or ``max_bytes`` bytes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 30,
+    ) -> CachedResponse:
+        request_headers = dict(headers or {})
+        key = self._key(url, request_headers)
+        entry = self._load(key)
+        if entry is not None:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = http_session.get(url, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and entry is not None:
+            logger.debug("HTTP cache revalidated: %s", url)
+            self._touch(key)
+            return CachedResponse(
+                url=url,
+                status_code=int(entry.get("status_code", 200)),
+                text=entry["body"],
+                headers=CaseInsensitiveDict(entry.get("headers", {})),
+                from_cache=True,
+            )
+
+        result = CachedResponse(
+            url=url,
+            status_code=response.status_code,
+            text=response.text,
+            headers=CaseInsensitiveDict(response.headers),
+        )
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified):
+            self._store(
+                key,
+                {
+                    "url": url,
+                    "status_code": response.status_code,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "headers": dict(result.headers),
+                    "body": result.text,
+                    "stored_at": time.time(),
+                },
+            )
+        return result
+
+    @staticmethod
+    def _key(url: str, headers: Mapping[str, str]) -> str:
+        # Accept participates in the key because registries negotiate payload shape on it.
+        accept = next((value for name, value in headers.items() if name.lower() == "accept"), "")
+        return hashlib.sha256(f"{accept}\n{url}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug("Discarding unreadable HTTP cache entry %s: %s", path, exc)
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(data, dict) or "body" not in data:
+            return None
+        return data
+
+    def _touch(self, key: str) -> None:
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def _store(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            tmp_name = None
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                    json.dump(entry, stream)
+                os.replace(tmp_name, self._path(key))
+            except OSError as exc:
+                if tmp_name is not None:
+                    Path(tmp_name).unlink(missing_ok=True)
+                logger.debug("Failed to write HTTP cache entry for %s: %s", entry.get("url"), exc)
+                return
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort(key=lambda item: item[0])
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+
+@lru_cache(maxsize=1)
+def default_cache() -> Optional[HTTPCache]:
+    """Return the process-wide cache, or ``None`` when ``MAINTENANCE_HTTP_CACHE`` disables it."""
+    if os.getenv("MAINTENANCE_HTTP_CACHE", "1").lower() in {"0", "false", "no", "off"}:
+        return None
+    cache_dir = os.getenv("MAINTENANCE_HTTP_CACHE_DIR")
+    return HTTPCache(Path(cache_dir) if cache_dir else _default_cache_dir())
+
+
+def cached_get(
+    url: str,
+    headers: Optional[Mapping[str, str]] = None,
+    timeout: float = 30,
+) -> CachedResponse:
+    """GET ``url`` through the default on-disk cache (or directly when it is disabled)."""
+    cache = default_cache()
+    if cache is not None:
+        return cache.get(url, headers=headers, timeout=timeout)
+
+    response = http_session.get(url, headers=dict(headers or {}), timeout=timeout)
+    return CachedResponse(
+        url=url,
+        status_code=response.status_code,
+        text=response.text,
+        headers=CaseInsensitiveDict(response.headers),
+    )
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "room-of-requirement-maintenance-robot"
+DEFAULT_TIMEOUT = 30
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 16
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    method: str
+    url: str
+    host: str
+    status_code: int
+    elapsed: float
+    content_length: int | None = None
+
+
+TimingHook = Callable[[RequestTiming], None]
+
+
+class RequestTimings:
+    """Thread-safe collector of per-request timings, summarised per host."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._timings: List[RequestTiming] = []
+
+    def __call__(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self._timings.append(timing)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            timings = list(self._timings)
+        per_host: Dict[str, Dict[str, float]] = defaultdict(lambda: {"requests": 0, "seconds": 0.0})
+        for timing in timings:
+            per_host[timing.host]["requests"] += 1
+            per_host[timing.host]["seconds"] += timing.elapsed
+        return {host: {"requests": data["requests"], "seconds": round(data["seconds"], 3)} for host, data in sorted(per_host.items())}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timings.clear()
+
+
+timings = RequestTimings()
+_timing_hooks: List[TimingHook] = [timings]
+
+
+def add_timing_hook(hook: TimingHook) -> None:
+    """Register a callback invoked with a ``RequestTiming`` after every response."""
+    _timing_hooks.append(hook)
+
+
+def remove_timing_hook(hook: TimingHook) -> None:
+    if hook in _timing_hooks:
+        _timing_hooks.remove(hook)
+
+
+def api_retry(*error_types: type[BaseException]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Shared retry/backoff policy for registry calls.
+
+    Retries transport failures plus the client-specific ``error_types`` up to
+    four attempts with exponential backoff between 1 and 8 seconds.
+    """
+    return retry(
+        wait=wait_exponential(multiplier=1, min=1, max=8),
+        stop=stop_after_attempt(4),
+        retry=retry_if_exception_type((requests.RequestException, *error_types)),
+    )
+
+
+def _accept_encoding() -> str:
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return "gzip, deflate"
+    return "gzip, deflate, br"
+
+
+def _record_timing(response: requests.Response, *_args: Any, **_kwargs: Any) -> None:
+    content_length = response.headers.get("Content-Length")
+    timing = RequestTiming(
+        method=response.request.method or "GET",
+        url=response.url,
+        host=urlparse(response.url).netloc,
+        status_code=response.status_code,
+        elapsed=response.elapsed.total_seconds(),
+        content_length=int(content_length) if content_length and content_length.isdigit() else None,
+    )
+    logger.debug(
+        "%s %s -> %s in %.3fs",
+        timing.method,
+        timing.url,
+        timing.status_code,
+        timing.elapsed,
+    )
+    for hook in list(_timing_hooks):
+        try:
+            hook(timing)
+        except Exception:  # pragma: no cover - hooks must never break a request
+            logger.debug("HTTP timing hook %r failed", hook, exc_info=True)
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """Return the process-wide session with keep-alive pools for every host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": _accept_encoding(),
+        }
+    )
+    session.hooks["response"].append(_record_timing)
+    return session
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session().get(url, **kwargs)
+
+
+def head(url: str, **kwargs: Any) -> requests.Response:
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session().head(url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session().post(url, **kwargs)
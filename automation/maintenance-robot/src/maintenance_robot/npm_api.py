@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Optional
+from urllib.parse import quote
 
-import requests
-from packaging.version import InvalidVersion, Version
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from packaging.version import Version
+
+from .http_cache import cached_get
+from .http_session import api_retry
+from .versions import parse_version, select_latest
 
 logger = logging.getLogger(__name__)
 
 NPM_REGISTRY_ROOT = "https://registry.npmjs.org"
+NPM_ABBREVIATED_ACCEPT = "application/vnd.npm.install-v1+json; q=1.0, application/json; q=0.8"
 
 
 class NPMAPIError(RuntimeError):
@@ -24,19 +29,23 @@ class PackageInfo:
     version_str: str
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=8),
-    stop=stop_after_attempt(4),
-    retry=retry_if_exception_type((requests.RequestException, NPMAPIError)),
-)
-def _get(url: str) -> dict:
-    response = requests.get(url, timeout=30)
+@api_retry(NPMAPIError)
+def _get(url: str, accept: Optional[str] = None) -> dict:
+    response = cached_get(url, headers={"Accept": accept} if accept else None, timeout=30)
     if response.status_code >= 400:
         raise NPMAPIError(f"npm registry API error {response.status_code}: {response.text}")
+    started = time.perf_counter()
     try:
         data = response.json()
     except ValueError as exc:
         raise NPMAPIError("Failed to decode JSON from npm registry API") from exc
+    logger.debug(
+        "npm registry %s: %d bytes (cached: %s), parsed in %.1f ms",
+        url,
+        len(response.text),
+        response.from_cache,
+        (time.perf_counter() - started) * 1000,
+    )
     if not isinstance(data, dict):
         raise NPMAPIError("Expected dict response from npm registry API")
     return data
@@ -48,49 +57,57 @@ def fetch_latest_version(
     include_prerelease: bool = False,
     max_major: Optional[int] = None,
 ) -> Optional[PackageInfo]:
-    """Fetch the latest version for an npm package respecting constraints."""
+    """Fetch the latest version for an npm package respecting constraints.
+
+    The tiny dist-tags document answers the common case. The version list is
+    only needed when ``latest`` is filtered out by ``max_major`` or prereleases
+    are wanted; it is read from the abbreviated install metadata, falling back
+    to the full packument only if the registry will not serve that format.
+    """
+    if not include_prerelease:
+        dist_tags = _get(f"{NPM_REGISTRY_ROOT}/-/package/{quote(package, safe='@')}/dist-tags")
+        latest = _latest_within(package, dist_tags.get("latest"), max_major)
+        if latest is not None:
+            return latest
+
     url = f"{NPM_REGISTRY_ROOT}/{package}"
-    data = _get(url)
-
-    # Get dist-tags for latest version
-    dist_tags = data.get("dist-tags", {})
-    latest_tag = dist_tags.get("latest")
-
-    if latest_tag and not include_prerelease:
-        try:
-            version = Version(latest_tag)
-            if max_major is not None and version.major > max_major:
-                logger.debug(
-                    "Latest version %s exceeds max_major=%s, checking versions",
-                    latest_tag,
-                    max_major,
-                )
-            else:
-                return PackageInfo(version=version, version_str=latest_tag)
-        except InvalidVersion:
-            logger.warning("Invalid version from npm for %s: %s", package, latest_tag)
+    data = _get(url, accept=NPM_ABBREVIATED_ACCEPT)
+    if "versions" not in data:
+        logger.debug("Abbreviated metadata for %s lacks versions; fetching full packument", package)
+        data = _get(url)
+    return _select_version(package, data, include_prerelease, max_major)
 
-    # Fallback: parse all versions and find the best match
-    versions_data = data.get("versions", {})
-    valid_versions: list[tuple[Version, str]] = []
-
-    for version_str in versions_data:
-        try:
-            version = Version(version_str)
-            # Skip prereleases if not allowed
-            if not include_prerelease and version.is_prerelease:
-                continue
-            # Skip versions exceeding max_major
-            if max_major is not None and version.major > max_major:
-                continue
-            valid_versions.append((version, version_str))
-        except InvalidVersion:
-            logger.debug("Skipping invalid version: %s", version_str)
-
-    if not valid_versions:
-        return None
 
-    # Sort and return the latest
-    valid_versions.sort(reverse=True)
-    version, version_str = valid_versions[0]
+def _latest_within(package: str, latest_tag: Optional[str], max_major: Optional[int]) -> Optional[PackageInfo]:
+    if latest_tag:
+        version = parse_version(latest_tag)
+        if version is None:
+            logger.warning("Invalid version from npm for %s: %s", package, latest_tag)
+        elif max_major is not None and version.major > max_major:
+            logger.debug(
+                "Latest version %s exceeds max_major=%s, checking versions",
+                latest_tag,
+                max_major,
+            )
+        else:
+            return PackageInfo(version=version, version_str=latest_tag)
+    return None
+
+
+def _select_version(
+    package: str,
+    data: dict,
+    include_prerelease: bool,
+    max_major: Optional[int],
+) -> Optional[PackageInfo]:
+    if not include_prerelease:
+        latest = _latest_within(package, data.get("dist-tags", {}).get("latest"), max_major)
+        if latest is not None:
+            return latest
+
+    # Fallback: pick the best match from all published versions
+    best = select_latest(data.get("versions", {}), include_prerelease, max_major)
+    if best is None:
+        return None
+    version, version_str = best
     return PackageInfo(version=version, version_str=version_str)
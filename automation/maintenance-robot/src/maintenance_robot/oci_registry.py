@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from . import http_session
+from .http_session import api_retry
+
+logger = logging.getLogger(__name__)
+
+DOCKER_HUB_REGISTRY = "registry-1.docker.io"
+_DOCKER_HUB_ALIASES = {"docker.io", "index.docker.io", "registry-1.docker.io", "registry.hub.docker.com"}
+_PLAIN_HTTP_HOSTS = {"localhost", "127.0.0.1"}
+
+# Prefer the multi-platform index so the digest matches what ``docker pull`` pins
+MANIFEST_ACCEPT = ", ".join(
+    [
+        "application/vnd.oci.image.index.v1+json",
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.oci.image.manifest.v1+json",
+        "application/vnd.docker.distribution.manifest.v2+json",
+    ]
+)
+DEFAULT_TOKEN_TTL = 60
+_TOKEN_EXPIRY_MARGIN = 10
+_CHALLENGE_PARAM = re.compile(r'(\w+)="([^"]*)"')
+
+
+class OCIRegistryError(RuntimeError):
+    """Raised when an OCI distribution registry request fails."""
+
+
+@dataclass(frozen=True)
+class ImageReference:
+    registry: str
+    repository: str
+    tag: str = "latest"
+
+    @classmethod
+    def parse(cls, reference: str, tag: Optional[str] = None) -> "ImageReference":
+        """Parse ``[registry/]repository[:tag][@digest]`` the way ``docker pull`` does.
+
+        References without a registry host go to Docker Hub, and single-component
+        Docker Hub names get the implicit ``library/`` prefix. An explicit ``tag``
+        argument wins over one embedded in ``reference``.
+        """
+        name = reference.split("@", 1)[0]
+        embedded_tag = None
+        last_slash = name.rfind("/")
+        colon = name.rfind(":")
+        if colon > last_slash:
+            name, embedded_tag = name[:colon], name[colon + 1:]
+
+        first, _, rest = name.partition("/")
+        if rest and ("." in first or ":" in first or first == "localhost"):
+            registry, repository = first, rest
+        else:
+            registry, repository = "docker.io", name
+
+        if registry in _DOCKER_HUB_ALIASES:
+            registry = DOCKER_HUB_REGISTRY
+            if "/" not in repository:
+                repository = f"library/{repository}"
+        return cls(registry=registry, repository=repository, tag=tag or embedded_tag or "latest")
+
+    @property
+    def manifest_url(self) -> str:
+        # Like docker, talk plain HTTP only to local registries (e.g. a test ``registry:2``)
+        scheme = "http" if self.registry.partition(":")[0] in _PLAIN_HTTP_HOSTS else "https"
+        return f"{scheme}://{self.registry}/v2/{self.repository}/manifests/{self.tag}"
+
+
+class OCIRegistryClient:
+    """Minimal OCI distribution client that resolves tags to manifest digests.
+
+    Only ``HEAD /v2/<repository>/manifests/<tag>`` is used, so a digest lookup
+    costs one small request instead of a tag listing. Anonymous bearer tokens
+    obtained from the ``WWW-Authenticate`` challenge are cached per registry
+    and repository until shortly before they expire.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tokens: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+    @api_retry(OCIRegistryError)
+    def resolve_digest(self, reference: str, tag: Optional[str] = None) -> str:
+        """Return the ``sha256:...`` manifest (list) digest for ``reference``."""
+        image = ImageReference.parse(reference, tag)
+        response = self._request_manifest(image, "HEAD")
+        digest = response.headers.get("Docker-Content-Digest")
+        if not digest:
+            # Some registries omit the header on HEAD; hash the manifest body instead
+            response = self._request_manifest(image, "GET")
+            digest = response.headers.get("Docker-Content-Digest") or (
+                "sha256:" + hashlib.sha256(response.content).hexdigest()
+            )
+        logger.debug("Resolved %s/%s:%s -> %s", image.registry, image.repository, image.tag, digest)
+        return digest
+
+    def _request_manifest(self, image: ImageReference, method: str) -> requests.Response:
+        send = http_session.head if method == "HEAD" else http_session.get
+        headers = {"Accept": MANIFEST_ACCEPT}
+        token = self._cached_token(image)
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        response = send(image.manifest_url, headers=headers)
+        if response.status_code == 401:
+            token = self._authenticate(image, response.headers.get("WWW-Authenticate", ""))
+            headers["Authorization"] = f"Bearer {token}"
+            response = send(image.manifest_url, headers=headers)
+        if response.status_code >= 400:
+            raise OCIRegistryError(
+                f"Registry error {response.status_code} for {image.registry}/{image.repository}:{image.tag}"
+            )
+        return response
+
+    def _cached_token(self, image: ImageReference) -> Optional[str]:
+        with self._lock:
+            cached = self._tokens.get((image.registry, _pull_scope(image)))
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        return None
+
+    def _authenticate(self, image: ImageReference, challenge: str) -> str:
+        scheme, _, params_text = challenge.partition(" ")
+        if scheme.lower() != "bearer":
+            raise OCIRegistryError(f"Unsupported registry auth challenge for {image.registry}: {challenge!r}")
+        params = dict(_CHALLENGE_PARAM.findall(params_text))
+        realm = params.get("realm")
+        if not realm:
+            raise OCIRegistryError(f"Registry auth challenge without realm for {image.registry}")
+        service = params.get("service", "")
+        scope = params.get("scope") or _pull_scope(image)
+
+        query = {"scope": scope}
+        if service:
+            query["service"] = service
+        response = http_session.get(realm, params=query)
+        if response.status_code >= 400:
+            raise OCIRegistryError(f"Token request to {realm} failed with {response.status_code}")
+        try:
+            payload = response.json()
+        except ValueError as exc:
+            raise OCIRegistryError(f"Failed to decode token response from {realm}") from exc
+        token = payload.get("token") or payload.get("access_token")
+        if not token:
+            raise OCIRegistryError(f"Token response from {realm} has no token")
+
+        ttl = int(payload.get("expires_in") or DEFAULT_TOKEN_TTL)
+        expires_at = time.monotonic() + max(ttl - _TOKEN_EXPIRY_MARGIN, 0)
+        with self._lock:
+            self._tokens[(image.registry, _pull_scope(image))] = (token, expires_at)
+        logger.debug("🔐 Obtained anonymous pull token for %s (expires in %ds)", scope, ttl)
+        return token
+
+
+def _pull_scope(image: ImageReference) -> str:
+    return f"repository:{image.repository}:pull"
+
+
+@lru_cache(maxsize=1)
+def default_client() -> OCIRegistryClient:
+    """Return the process-wide client so tokens are shared across lookups."""
+    return OCIRegistryClient()
+
+
+def resolve_digest(reference: str, tag: Optional[str] = None) -> str:
+    """Resolve ``reference`` (optionally overriding its tag) to a manifest digest."""
+    return default_client().resolve_digest(reference, tag)
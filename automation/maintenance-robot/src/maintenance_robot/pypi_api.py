@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Optional
 
-import requests
-from packaging.version import InvalidVersion, Version
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from packaging.utils import canonicalize_name
+from packaging.version import Version
+
+from .http_cache import cached_get
+from .http_session import api_retry
+from .versions import parse_version, select_latest
 
 logger = logging.getLogger(__name__)
 
 PYPI_API_ROOT = "https://pypi.org/pypi"
+PYPI_SIMPLE_ROOT = "https://pypi.org/simple"
+PYPI_SIMPLE_ACCEPT = "application/vnd.pypi.simple.v1+json"
 
 
 class PyPIAPIError(RuntimeError):
@@ -24,21 +30,25 @@ class PackageInfo:
     version_str: str
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=8),
-    stop=stop_after_attempt(4),
-    retry=retry_if_exception_type((requests.RequestException, PyPIAPIError)),
-)
-def _get(url: str) -> dict:
-    response = requests.get(url, timeout=30)
+@api_retry(PyPIAPIError)
+def _get(url: str, accept: Optional[str] = None) -> dict:
+    response = cached_get(url, headers={"Accept": accept} if accept else None, timeout=30)
     if response.status_code >= 400:
         raise PyPIAPIError(f"PyPI API error {response.status_code}: {response.text}")
+    started = time.perf_counter()
     try:
         data = response.json()
     except ValueError as exc:
         raise PyPIAPIError("Failed to decode JSON from PyPI API") from exc
     if not isinstance(data, dict):
         raise PyPIAPIError("Expected dict response from PyPI API")
+    logger.debug(
+        "PyPI %s: %d bytes (cached: %s), parsed in %.1f ms",
+        url,
+        len(response.text),
+        response.from_cache,
+        (time.perf_counter() - started) * 1000,
+    )
     return data
 
 
@@ -48,48 +58,64 @@ def fetch_latest_version(
     include_prerelease: bool = False,
     max_major: Optional[int] = None,
 ) -> Optional[PackageInfo]:
-    """Fetch the latest version for a PyPI package respecting constraints."""
-    url = f"{PYPI_API_ROOT}/{package}/json"
-    data = _get(url)
+    """Fetch the latest version for a PyPI package respecting constraints.
+
+    Candidates come from the ``versions`` list of the Simple JSON API (PEP 691/700)
+    and the winner is checked against its per-version document so yanked
+    releases are skipped. The legacy ``/pypi/<package>/json`` document, which
+    carries file listings for every release, is only read when the index does
+    not expose a version list.
+    """
+    simple = _get(f"{PYPI_SIMPLE_ROOT}/{canonicalize_name(package)}/", accept=PYPI_SIMPLE_ACCEPT)
+    version_strings = simple.get("versions")
+    if not isinstance(version_strings, list):
+        logger.debug("Simple API for %s lacks a version list; using the legacy JSON API", package)
+        return _fetch_from_legacy_json(package, include_prerelease, max_major)
+
+    remaining = list(version_strings)
+    while remaining:
+        best = select_latest(remaining, include_prerelease, max_major)
+        if best is None:
+            break
+        version, version_str = best
+        if not _is_yanked(package, version_str):
+            return PackageInfo(version=version, version_str=version_str)
+        logger.debug("Skipping yanked release %s==%s", package, version_str)
+        remaining.remove(version_str)
+    return None
+
+
+def _is_yanked(package: str, version_str: str) -> bool:
+    data = _get(f"{PYPI_API_ROOT}/{package}/{version_str}/json")
+    return bool(data.get("info", {}).get("yanked"))
+
+
+def _fetch_from_legacy_json(
+    package: str,
+    include_prerelease: bool,
+    max_major: Optional[int],
+) -> Optional[PackageInfo]:
+    data = _get(f"{PYPI_API_ROOT}/{package}/json")
 
     # PyPI returns latest stable version in 'info' by default
     if not include_prerelease:
         latest = data.get("info", {}).get("version")
         if latest:
-            try:
-                version = Version(latest)
-                if max_major is not None and version.major > max_major:
-                    logger.debug(
-                        "Latest version %s exceeds max_major=%s, checking releases",
-                        latest,
-                        max_major,
-                    )
-                else:
-                    return PackageInfo(version=version, version_str=latest)
-            except InvalidVersion:
+            version = parse_version(latest)
+            if version is None:
                 logger.warning("Invalid version from PyPI for %s: %s", package, latest)
-
-    # Fallback: parse all releases and find the best match
-    releases = data.get("releases", {})
-    valid_versions: list[tuple[Version, str]] = []
-
-    for version_str in releases:
-        try:
-            version = Version(version_str)
-            # Skip prereleases if not allowed
-            if not include_prerelease and version.is_prerelease:
-                continue
-            # Skip versions exceeding max_major
-            if max_major is not None and version.major > max_major:
-                continue
-            valid_versions.append((version, version_str))
-        except InvalidVersion:
-            logger.debug("Skipping invalid version: %s", version_str)
-
-    if not valid_versions:
+            elif max_major is not None and version.major > max_major:
+                logger.debug(
+                    "Latest version %s exceeds max_major=%s, checking releases",
+                    latest,
+                    max_major,
+                )
+            else:
+                return PackageInfo(version=version, version_str=latest)
+
+    # Fallback: pick the best match from all releases
+    best = select_latest(data.get("releases", {}), include_prerelease, max_major)
+    if best is None:
         return None
-
-    # Sort and return the latest
-    valid_versions.sort(reverse=True)
-    version, version_str = valid_versions[0]
+    version, version_str = best
     return PackageInfo(version=version, version_str=version_str)
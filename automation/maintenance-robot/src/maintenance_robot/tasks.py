@@ -3,10 +3,12 @@ from __future__ import annotations
 import json
 import logging
 import os
+import shutil
 import subprocess
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
+import requests
 from robocorp.tasks import get_current_task, get_output_dir, task
 
 from maintenance_robot.allowlist_loader import load_allowlist
@@ -14,6 +16,8 @@ from maintenance_robot.brewfiles import BrewfileValidator
 from maintenance_robot.downloads import DownloadsUpdater
 from maintenance_robot.github_actions import GitHubActionsUpdater
 from maintenance_robot.homebrew import HomebrewUpdater
+from maintenance_robot.homebrew_index import HomebrewIndex, HomebrewIndexError
+from maintenance_robot.http_session import timings as http_timings
 from maintenance_robot.reporter import MaintenanceReport
 from maintenance_robot.devcontainer_lock import update_devcontainer_lockfile
 
@@ -63,7 +67,11 @@ def maintenance() -> None:
     # Log Homebrew versions for informational purposes (no updates)
     homebrew_allowlist = allowlists.get("homebrew", {})
     if homebrew_allowlist:
-        homebrew_updater = HomebrewUpdater(homebrew_allowlist, report=report)
+        homebrew_updater = HomebrewUpdater(
+            homebrew_allowlist,
+            report=report,
+            use_bulk_index=_env_flag("HOMEBREW_BULK_INDEX"),
+        )
         versions = homebrew_updater.update_formulas()
         if versions:
             logging.info("Homebrew formula versions (baked into image): %s", versions)
@@ -159,7 +167,11 @@ def update_homebrew_only() -> None:
     """
     allowlists = _load_allowlists()
     report = MaintenanceReport()
-    homebrew_updater = HomebrewUpdater(allowlists.get("homebrew", {}), report=report)
+    homebrew_updater = HomebrewUpdater(
+        allowlists.get("homebrew", {}),
+        report=report,
+        use_bulk_index=_env_flag("HOMEBREW_BULK_INDEX"),
+    )
     versions = homebrew_updater.update_formulas()
     if versions:
         logging.info("Homebrew formula versions (baked into image): %s", versions)
@@ -182,6 +194,10 @@ def validate_brewfiles_only() -> None:
         )
 
 
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").lower() in {"1", "true", "yes", "on"}
+
+
 def _load_allowlists() -> Dict[str, Dict[str, dict]]:
     allowlists_dir = ROBOT_ROOT / "allowlists"
     return {
@@ -197,13 +213,30 @@ def _validate_curated_brewfiles():
         logging.info("No curated Brewfile directory found at %s", brew_dir)
         return []
 
-    validator = BrewfileValidator()
+    validator = BrewfileValidator(index=_brewfile_validation_index())
     issues = validator.validate_directory(brew_dir)
     if not issues:
         logging.info("Curated Brewfile validation passed")
     return issues
 
 
+def _brewfile_validation_index() -> Optional[HomebrewIndex]:
+    """Pick the Brewfile validation backend from ``BREWFILE_VALIDATION_BACKEND``.
+
+    ``brew`` always shells out, ``index`` validates against the cached Homebrew
+    API index first, and ``auto`` (default) uses the index only when no
+    ``brew`` executable is available.
+    """
+    backend = os.getenv("BREWFILE_VALIDATION_BACKEND", "auto").lower()
+    if backend == "brew" or (backend == "auto" and shutil.which("brew")):
+        return None
+    try:
+        return HomebrewIndex.load()
+    except (requests.RequestException, HomebrewIndexError) as exc:
+        logging.warning("Could not load Homebrew API index for Brewfile validation: %s", exc)
+        return None
+
+
 def _resolve_output_dir() -> Path:
     output_dir = get_output_dir()
     if output_dir is not None:
@@ -225,6 +258,9 @@ def _write_report(report: MaintenanceReport) -> None:
     report_path = output_dir / "maintenance_report.json"
     report_path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
     logging.info("Wrote maintenance report for task '%s' to %s", _current_task_name(), report_path)
+    http_summary = http_timings.summary()
+    if http_summary:
+        logging.info("HTTP requests per host: %s", http_summary)
 
 
 def _refresh_precommit_configuration() -> None:
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from packaging.version import InvalidVersion, Version
+
+# Cheap gate in front of ``Version()``: an optional ``v`` and epoch followed by
+# a digit. Rejects tags such as ``latest``, ``bookworm`` or ``sha-1a2b3c`` without
+# running the full PEP 440 parser and raising ``InvalidVersion``.
+_VERSION_PREFILTER = re.compile(r"[vV]?(?:\d+!)?\d[0-9A-Za-z.+_-]*")
+
+PARSE_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_version(text: str) -> Optional[Version]:
+    """Parse ``text`` as a PEP 440 version, returning ``None`` when it is not one.
+
+    Results are memoized process-wide, so the same tag seen by several registry
+    clients (or on several runs of the same lookup) is parsed once.
+    """
+    candidate = text.strip()
+    if not _VERSION_PREFILTER.fullmatch(candidate):
+        return None
+    try:
+        return Version(candidate)
+    except InvalidVersion:
+        return None
+
+
+def allowed_version(
+    text: str,
+    include_prerelease: bool = False,
+    max_major: Optional[int] = None,
+) -> Optional[Version]:
+    """Return the parsed version when it satisfies the prerelease/major constraints."""
+    version = parse_version(text)
+    if version is None:
+        return None
+    if not include_prerelease and version.is_prerelease:
+        return None
+    if max_major is not None and version.major > max_major:
+        return None
+    return version
+
+
+def select_latest(
+    version_strings: Iterable[str],
+    include_prerelease: bool = False,
+    max_major: Optional[int] = None,
+) -> Optional[tuple[Version, str]]:
+    """Return ``(version, text)`` for the highest allowed version in a single pass.
+
+    Ties between equal versions spelled differently (``1.0`` and ``1.0.0``) are
+    broken on the string, matching a reverse sort of ``(version, text)`` tuples.
+    """
+    best: Optional[tuple[Version, str]] = None
+    for text in version_strings:
+        version = allowed_version(text, include_prerelease, max_major)
+        if version is None:
+            continue
+        candidate = (version, text)
+        if best is None or candidate > best:
+            best = candidate
+    return best
@@ -8,6 +8,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from maintenance_robot.brewfiles import BrewfileValidator
+from maintenance_robot.homebrew_index import HomebrewIndex
 
 
 class BrewfileValidatorTests(unittest.TestCase):
@@ -171,6 +172,171 @@ class BrewfileValidatorTests(unittest.TestCase):
             self.assertEqual([], issues)
             self.assertIn(["brew", "info", "--json=v2", "--formula", "terraform"], calls)
 
+    def test_batches_brew_info_across_brewfiles_and_bisects_failures(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brew_dir = Path(tmpdir)
+            (brew_dir / "core.Brewfile").write_text(
+                "\n".join(['brew "jq"', 'brew "renamed-tool"', 'cask "visual-studio-code"']) + "\n",
+                encoding="utf-8",
+            )
+            (brew_dir / "dev.Brewfile").write_text(
+                "\n".join(['brew "ripgrep"', 'brew "jq"']) + "\n",
+                encoding="utf-8",
+            )
+
+            calls: list[list[str]] = []
+
+            def fake_run(args: list[str], **_kwargs: object) -> subprocess.CompletedProcess[str]:
+                calls.append(args)
+                if "renamed-tool" in args:
+                    return subprocess.CompletedProcess(
+                        args,
+                        1,
+                        stdout="",
+                        stderr='Error: No available formula with the name "renamed-tool".',
+                    )
+                return subprocess.CompletedProcess(args, 0, stdout="{}", stderr="")
+
+            validator = BrewfileValidator(brew_executable="brew", require_brew=True)
+
+            with patch("maintenance_robot.brewfiles.subprocess.run", side_effect=fake_run):
+                issues = validator.validate_directory(brew_dir)
+
+            self.assertEqual(
+                [("core.Brewfile", "formula", "renamed-tool")],
+                [(issue.brewfile.name, issue.entry_type, issue.name) for issue in issues],
+            )
+            self.assertEqual('Error: No available formula with the name "renamed-tool".', issues[0].detail)
+            self.assertEqual(
+                [
+                    ["brew", "info", "--json=v2", "--formula", "jq", "renamed-tool", "ripgrep"],
+                    ["brew", "info", "--json=v2", "--formula", "jq"],
+                    ["brew", "info", "--json=v2", "--formula", "renamed-tool", "ripgrep"],
+                    ["brew", "info", "--json=v2", "--formula", "renamed-tool"],
+                    ["brew", "info", "--json=v2", "--formula", "ripgrep"],
+                    ["brew", "info", "--json=v2", "--cask", "visual-studio-code"],
+                ],
+                calls,
+            )
+
+    def test_queries_shared_taps_once_per_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brew_dir = Path(tmpdir)
+            for name in ("cloud", "dev", "ror"):
+                (brew_dir / f"{name}.Brewfile").write_text(
+                    "\n".join(['tap "hashicorp/tap"', 'tap "joshyorko/tools"', f'brew "joshyorko/tools/{name}-tool"'])
+                    + "\n",
+                    encoding="utf-8",
+                )
+
+            calls: list[list[str]] = []
+
+            def fake_run(args: list[str], **_kwargs: object) -> subprocess.CompletedProcess[str]:
+                calls.append(args)
+                if args[1] == "tap-info":
+                    stdout = json.dumps([{"formula_names": [], "cask_tokens": []}])
+                    return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+                return subprocess.CompletedProcess(args, 1, stdout="", stderr="unexpected command")
+
+            validator = BrewfileValidator(brew_executable="brew", require_brew=True, tap_workers=2)
+
+            with patch("maintenance_robot.brewfiles.subprocess.run", side_effect=fake_run):
+                issues = validator.validate_directory(brew_dir)
+
+            self.assertEqual([], issues)
+            self.assertEqual(2, len(calls))
+            self.assertCountEqual(
+                [
+                    ["brew", "tap-info", "--json", "hashicorp/tap"],
+                    ["brew", "tap-info", "--json", "joshyorko/tools"],
+                ],
+                calls,
+            )
+
+    def test_reports_failing_shared_tap_for_each_brewfile(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brew_dir = Path(tmpdir)
+            for name in ("cloud", "dev"):
+                (brew_dir / f"{name}.Brewfile").write_text('tap "missing/tap"\n', encoding="utf-8")
+
+            calls: list[list[str]] = []
+
+            def fake_run(args: list[str], **_kwargs: object) -> subprocess.CompletedProcess[str]:
+                calls.append(args)
+                return subprocess.CompletedProcess(args, 1, stdout="", stderr="Error: Invalid tap name")
+
+            validator = BrewfileValidator(brew_executable="brew", require_brew=True)
+
+            with patch("maintenance_robot.brewfiles.subprocess.run", side_effect=fake_run):
+                issues = validator.validate_directory(brew_dir)
+
+            self.assertEqual(1, len(calls))
+            self.assertEqual(
+                [("cloud.Brewfile", "tap", "missing/tap"), ("dev.Brewfile", "tap", "missing/tap")],
+                [(issue.brewfile.name, issue.entry_type, issue.name) for issue in issues],
+            )
+
+
+class BrewfileIndexBackendTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = HomebrewIndex.from_payloads(
+            [{"name": "kubernetes-cli", "aliases": ["kubectl"], "versions": {"stable": "1.34.1"}}],
+            [{"token": "visual-studio-code", "old_tokens": ["vscode"], "version": "1.105.0"}],
+        )
+
+    def test_validates_core_entries_offline_without_brew(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brew_dir = Path(tmpdir)
+            (brew_dir / "core.Brewfile").write_text(
+                "\n".join(
+                    [
+                        'tap "homebrew/cask"',
+                        'tap "hashicorp/tap"',
+                        'brew "kubectl"',
+                        'brew "homebrew/core/kubernetes-cli"',
+                        'brew "renamed-tool"',
+                        'brew "hashicorp/tap/terraform"',
+                        'cask "vscode"',
+                    ]
+                )
+                + "\n",
+                encoding="utf-8",
+            )
+
+            validator = BrewfileValidator(brew_executable=None, require_brew=False, index=self.index)
+            validator.brew_executable = None
+
+            with patch("maintenance_robot.brewfiles.subprocess.run", side_effect=AssertionError("no brew")):
+                issues = validator.validate_directory(brew_dir)
+
+            self.assertEqual(
+                [("core.Brewfile", "formula", "renamed-tool")],
+                [(issue.brewfile.name, issue.entry_type, issue.name) for issue in issues],
+            )
+
+    def test_falls_back_to_brew_for_third_party_taps(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            brew_dir = Path(tmpdir)
+            (brew_dir / "cloud.Brewfile").write_text(
+                "\n".join(['tap "hashicorp/tap"', 'brew "kubectl"', 'brew "hashicorp/tap/terraform"']) + "\n",
+                encoding="utf-8",
+            )
+
+            calls: list[list[str]] = []
+
+            def fake_run(args: list[str], **_kwargs: object) -> subprocess.CompletedProcess[str]:
+                calls.append(args)
+                stdout = json.dumps([{"formula_names": ["hashicorp/tap/terraform"], "cask_tokens": []}])
+                return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+            validator = BrewfileValidator(brew_executable="brew", require_brew=True, index=self.index)
+
+            with patch("maintenance_robot.brewfiles.subprocess.run", side_effect=fake_run):
+                issues = validator.validate_directory(brew_dir)
+
+            self.assertEqual([], issues)
+            self.assertEqual([["brew", "tap-info", "--json", "hashicorp/tap"]], calls)
+
 
 if __name__ == "__main__":
     unittest.main()
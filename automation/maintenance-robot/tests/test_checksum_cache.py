@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import hashlib
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+from maintenance_robot.checksum_cache import ChecksumCache
+
+URL = "https://github.com/example/tool/releases/download/v1.0.0/tool.tar.gz"
+
+
+def _response(body: bytes = b"", headers: dict[str, str] | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+class ChecksumCacheTests(unittest.TestCase):
+    def test_reuses_checksum_until_the_artifact_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "sha256.json"
+            etags = ['"v1"', '"v1"', '"v2"']
+            downloads: list[str] = []
+
+            def fake_head(url: str, **_kwargs: object) -> requests.Response:
+                return _response(headers={"ETag": etags.pop(0), "Content-Length": "7"})
+
+            def fake_get(url: str, **_kwargs: object) -> requests.Response:
+                downloads.append(url)
+                return _response(b"payload")
+
+            with patch("maintenance_robot.http_session.head", side_effect=fake_head), patch(
+                "maintenance_robot.http_session.get", side_effect=fake_get
+            ):
+                first = ChecksumCache(cache_path).sha256(URL)
+                # A fresh instance proves the entry was persisted to disk
+                second = ChecksumCache(cache_path).sha256(URL)
+                third = ChecksumCache(cache_path).sha256(URL)
+
+            expected = hashlib.sha256(b"payload").hexdigest()
+            self.assertEqual([expected] * 3, [first, second, third])
+            self.assertEqual(2, len(downloads))
+
+    def test_hashes_many_urls_concurrently_once_each(self) -> None:
+        def fake_get(url: str, **_kwargs: object) -> requests.Response:
+            return _response(url.encode("utf-8"))
+
+        with patch("maintenance_robot.http_session.head", return_value=_response()), patch(
+            "maintenance_robot.http_session.get", side_effect=fake_get
+        ) as get:
+            results = ChecksumCache().sha256_many([URL, URL + ".sig", URL])
+
+        self.assertEqual(2, get.call_count)
+        self.assertEqual(hashlib.sha256(URL.encode("utf-8")).hexdigest(), results[URL])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import threading
+import unittest
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from requests.structures import CaseInsensitiveDict
+
+from maintenance_robot import docker_hub_api
+from maintenance_robot.http_cache import CachedResponse
+
+CLI_REGEX = r"(?P<version>[0-9]+\.[0-9]+\.[0-9]+)-cli"
+
+
+class DockerHubTagSearchTests(unittest.TestCase):
+    def test_literal_filter(self) -> None:
+        self.assertEqual("-cli", docker_hub_api._literal_filter(CLI_REGEX))
+        self.assertEqual("-slim-bookwor", docker_hub_api._literal_filter(r"(?P<version>\d+)-slim-bookworm?"))
+        self.assertIsNone(docker_hub_api._literal_filter(r"v?(?P<version>\d+\.\d+)"))
+        self.assertIsNone(docker_hub_api._literal_filter(r"(?P<version>\d+)-cli|latest"))
+
+    def test_filters_server_side_and_stops_when_a_window_does_not_improve(self) -> None:
+        pages = {
+            1: ["28.1.0-cli", "28.0.4-cli"],
+            2: ["28.1.1-cli", "27.5.1-cli"],
+            3: ["27.5.0-cli", "26.1.4-cli"],
+            4: ["29.0.0-cli"],
+        }
+        requested: list[dict[str, list[str]]] = []
+        lock = threading.Lock()
+
+        def fake_cached_get(url: str, timeout: float = 30) -> CachedResponse:
+            query = parse_qs(urlparse(url).query)
+            with lock:
+                requested.append(query)
+            page = int(query["page"][0])
+            payload = {
+                "count": 8,
+                "next": "more" if page < 4 else None,
+                "results": [{"name": name, "digest": "sha256:" + "a" * 64} for name in pages[page]],
+            }
+            return CachedResponse(url, 200, json.dumps(payload), CaseInsensitiveDict(), False)
+
+        with patch.object(docker_hub_api, "cached_get", side_effect=fake_cached_get):
+            tag = docker_hub_api.fetch_latest_version(
+                "library/docker", CLI_REGEX, max_major=28, page_size=2, window=1
+            )
+
+        assert tag is not None
+        self.assertEqual("28.1.1-cli", tag.tag)
+        self.assertEqual("a" * 64, tag.digest)
+        self.assertEqual([1, 2, 3], sorted(int(query["page"][0]) for query in requested))
+        self.assertTrue(all(query["name"] == ["-cli"] and query["ordering"] == ["last_updated"] for query in requested))
+
+
+if __name__ == "__main__":
+    unittest.main()
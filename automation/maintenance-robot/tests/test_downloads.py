@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from packaging.version import Version
+
+from maintenance_robot import downloads
+from maintenance_robot.downloads import DownloadsUpdater, ResolvedDownload
+from maintenance_robot.pypi_api import PackageInfo
+from maintenance_robot.reporter import MaintenanceReport
+
+
+def _pypi_entry(package: str, file: str = "conda.yaml") -> dict:
+    return {
+        "source": "pypi",
+        "package": package,
+        "targets": [
+            {
+                "file": file,
+                "patterns": [f"{package}==(?P<version>[0-9]+\\.[0-9]+\\.[0-9]+)"],
+            }
+        ],
+    }
+
+
+class DownloadsResolveTests(unittest.TestCase):
+    def test_resolves_concurrently_within_per_host_limit(self) -> None:
+        allowlist = {f"pkg{index}": _pypi_entry(f"pkg{index}") for index in range(6)}
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_fetch(package: str, **_kwargs: object) -> PackageInfo:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return PackageInfo(version=Version("1.2.3"), version_str="1.2.3")
+
+        updater = DownloadsUpdater(
+            allowlist,
+            repo_root=Path("."),
+            report=MaintenanceReport(),
+            max_workers=6,
+            max_per_host=2,
+        )
+
+        with patch("maintenance_robot.downloads.fetch_pypi_version", side_effect=fake_fetch):
+            resolutions = updater.resolve_versions()
+
+        self.assertEqual(sorted(allowlist), sorted(resolutions))
+        self.assertEqual(2, peak)
+
+    def test_update_targets_rewrites_files_from_resolution_table(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_root = Path(tmpdir)
+            (repo_root / "conda.yaml").write_text(
+                "  - pip:\n      - requests==2.0.0\n      - click==8.0.0\n",
+                encoding="utf-8",
+            )
+            allowlist = {"requests": _pypi_entry("requests"), "click": _pypi_entry("click")}
+            latest = {"requests": "2.34.2", "click": "8.0.0"}
+
+            def fake_fetch(package: str, **_kwargs: object) -> PackageInfo:
+                return PackageInfo(version=Version(latest[package]), version_str=latest[package])
+
+            report = MaintenanceReport()
+            updater = DownloadsUpdater(allowlist, repo_root=repo_root, report=report)
+
+            with patch("maintenance_robot.downloads.fetch_pypi_version", side_effect=fake_fetch):
+                updater.update_targets()
+
+            self.assertEqual(
+                "  - pip:\n      - requests==2.34.2\n      - click==8.0.0\n",
+                (repo_root / "conda.yaml").read_text(encoding="utf-8"),
+            )
+            self.assertEqual(["requests"], [update.identifier for update in report.downloads])
+
+
+class DownloadsRewriteTests(unittest.TestCase):
+    def test_writes_each_file_once_with_version_and_sha256_edits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_root = Path(tmpdir)
+            (repo_root / "Dockerfile").write_text(
+                "ARG DOCKER_CLI_IMAGE=docker:29.0.0-cli@sha256:" + "a" * 64 + "\n"
+                "ARG DOCKER_COMPOSE_VERSION=v5.0.0\n",
+                encoding="utf-8",
+            )
+            allowlist = {
+                "docker-cli-image": {
+                    "source": "docker_hub",
+                    "repo": "library/docker",
+                    "tag_regex": "(?P<version>[0-9]+\\.[0-9]+\\.[0-9]+)-cli",
+                    "targets": [
+                        {
+                            "file": "Dockerfile",
+                            "patterns": [
+                                "ARG DOCKER_CLI_IMAGE=docker:(?P<version>[0-9]+\\.[0-9]+\\.[0-9]+)-cli@sha256:[a-f0-9]+"
+                            ],
+                            "sha256_pattern": "ARG DOCKER_CLI_IMAGE=docker:[0-9.]+-cli@sha256:(?P<sha256>[a-f0-9]+)",
+                        }
+                    ],
+                },
+                "docker-compose": {
+                    "source": "release",
+                    "repo": "docker/compose",
+                    "targets": [
+                        {
+                            "file": "Dockerfile",
+                            "patterns": ["ARG DOCKER_COMPOSE_VERSION=v(?P<version>[0-9]+\\.[0-9]+\\.[0-9]+)"],
+                        }
+                    ],
+                },
+            }
+            resolutions = {
+                "docker-cli-image": ResolvedDownload(Version("29.7.2"), "29.7.2", sha256="sha256:" + "b" * 64),
+                "docker-compose": ResolvedDownload(Version("5.5.0"), "v5.5.0"),
+            }
+
+            updater = DownloadsUpdater(allowlist, repo_root=repo_root, report=MaintenanceReport())
+            with patch.object(updater, "resolve_versions", return_value=resolutions), patch(
+                "maintenance_robot.downloads._atomic_write_text",
+                wraps=downloads._atomic_write_text,
+            ) as write:
+                updater.update_targets()
+
+            self.assertEqual(1, write.call_count)
+            self.assertEqual(
+                "ARG DOCKER_CLI_IMAGE=docker:29.7.2-cli@sha256:" + "b" * 64 + "\n"
+                "ARG DOCKER_COMPOSE_VERSION=v5.5.0\n",
+                (repo_root / "Dockerfile").read_text(encoding="utf-8"),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from maintenance_robot import github_api
+from maintenance_robot.github_api import ReleaseQuery, fetch_latest_versions
+
+
+def _json_response(payload: object, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+
+class GitHubGraphQLBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        github_api.fetch_latest_version.cache_clear()
+
+    def test_resolves_releases_and_tags_in_one_graphql_call(self) -> None:
+        checkout = ReleaseQuery(repo="actions/checkout", max_major=5)
+        features = ReleaseQuery(repo="devcontainers/features", source="tag", feature_name="node")
+        posted: list[dict] = []
+
+        def fake_post(url: str, json: dict, headers: dict[str, str]) -> requests.Response:
+            posted.append(json)
+            return _json_response(
+                {
+                    "data": {
+                        "r0": {
+                            "releases": {
+                                "nodes": [
+                                    {"tagName": "v6.0.0", "isPrerelease": False, "isDraft": False, "tagCommit": {"oid": "6" * 40}},
+                                    {"tagName": "v5.1.0-rc.1", "isPrerelease": True, "isDraft": False, "tagCommit": {"oid": "r" * 40}},
+                                    {"tagName": "v5.0.1", "isPrerelease": False, "isDraft": False, "tagCommit": {"oid": "5" * 40}},
+                                ]
+                            }
+                        },
+                        "r1": {
+                            "refs": {
+                                "nodes": [
+                                    {
+                                        "name": "feature_node_1.6.3",
+                                        "target": {"__typename": "Tag", "oid": "t" * 40, "target": {"oid": "c" * 40}},
+                                    }
+                                ]
+                            }
+                        },
+                    }
+                }
+            )
+
+        with patch.object(github_api, "_github_token", return_value="token"), patch(
+            "maintenance_robot.http_session.post", side_effect=fake_post
+        ), patch.object(github_api, "_fetch_page", side_effect=AssertionError("REST should not be used")):
+            results = fetch_latest_versions([checkout, features, checkout])
+
+        self.assertEqual(1, len(posted))
+        self.assertEqual({"query1": "feature_node_"}, {k: v for k, v in posted[0]["variables"].items() if k.startswith("query")})
+        self.assertEqual("v5.0.1", results[checkout].tag)
+        self.assertEqual("5" * 40, results[checkout].sha)
+        self.assertEqual("feature_node_1.6.3", results[features].tag)
+        self.assertEqual("c" * 40, results[features].sha)
+
+    def test_falls_back_to_rest_without_token(self) -> None:
+        query = ReleaseQuery(repo="docker/compose", pin_to_sha=False)
+        with patch.object(github_api, "_github_token", return_value=None), patch(
+            "maintenance_robot.http_session.post", side_effect=AssertionError("GraphQL requires a token")
+        ), patch.object(github_api, "_fetch_page", return_value=([{"tag_name": "v5.5.0"}], None)):
+            results = fetch_latest_versions([query])
+
+        self.assertEqual("v5.5.0", results[query].tag)
+        self.assertIsNone(results[query].sha)
+
+
+class GitHubPaginationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        github_api.fetch_latest_version.cache_clear()
+
+    def test_stops_fetching_pages_once_a_match_is_found(self) -> None:
+        pages = {
+            "https://api.github.com/repos/devcontainers/features/tags?per_page=100": (
+                [{"name": "feature_go_1.3.0", "commit": {"sha": "g" * 40}}],
+                "https://api.github.com/repositories/1/tags?per_page=100&page=2",
+            ),
+            "https://api.github.com/repositories/1/tags?per_page=100&page=2": (
+                [{"name": "feature_node_1.6.3", "commit": {"sha": "n" * 40}}],
+                "https://api.github.com/repositories/1/tags?per_page=100&page=3",
+            ),
+        }
+        fetched: list[str] = []
+
+        def fake_fetch_page(url: str) -> tuple[list[dict], str | None]:
+            fetched.append(url)
+            return pages[url]
+
+        with patch.object(github_api, "_fetch_page", side_effect=fake_fetch_page):
+            release = github_api.fetch_latest_version(
+                "devcontainers/features",
+                "tag",
+                feature_name="node",
+            )
+
+        assert release is not None
+        self.assertEqual("feature_node_1.6.3", release.tag)
+        self.assertEqual(list(pages), fetched)
+
+    def test_follows_link_header_next_url(self) -> None:
+        link = (
+            '<https://api.github.com/repositories/1/tags?per_page=100&page=2>; rel="next", '
+            '<https://api.github.com/repositories/1/tags?per_page=100&page=9>; rel="last"'
+        )
+        self.assertEqual(
+            "https://api.github.com/repositories/1/tags?per_page=100&page=2",
+            github_api._next_page_url(link),
+        )
+        self.assertIsNone(github_api._next_page_url(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
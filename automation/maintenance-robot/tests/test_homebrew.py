@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from maintenance_robot.homebrew import HomebrewUpdater
+from maintenance_robot.homebrew_index import HomebrewIndex
+from maintenance_robot.reporter import MaintenanceReport
+
+FORMULAE = [
+    {
+        "name": "kubernetes-cli",
+        "full_name": "kubernetes-cli",
+        "aliases": ["kubectl"],
+        "oldnames": ["kubernetes-client"],
+        "versions": {"stable": "1.34.1", "head": "HEAD"},
+        "desc": "Kubernetes command-line interface",
+    },
+    {"name": "mise", "full_name": "mise", "aliases": [], "versions": {"stable": "2026.10.1"}},
+]
+CASKS = [
+    {"token": "claude-code", "full_token": "claude-code", "old_tokens": ["claude"], "version": "2.1.0"},
+]
+
+
+class HomebrewIndexTests(unittest.TestCase):
+    def test_resolves_names_aliases_and_old_names(self) -> None:
+        index = HomebrewIndex.from_payloads(FORMULAE, CASKS)
+
+        self.assertEqual("1.34.1", index.version("kubernetes-cli"))
+        self.assertEqual("1.34.1", index.version("kubectl"))
+        self.assertEqual("1.34.1", index.version("kubernetes-client"))
+        self.assertEqual("1.34.1", index.version("homebrew/core/kubernetes-cli"))
+        self.assertEqual("2.1.0", index.version("claude", "cask"))
+        self.assertIsNone(index.version("claude-code"))
+        self.assertFalse(index.contains("hashicorp/tap/terraform"))
+        self.assertGreater(index.approximate_size(), 0)
+
+    def test_updater_uses_index_and_falls_back_to_api_for_misses(self) -> None:
+        allowlist = {
+            "mise": {"formula": "mise"},
+            "terraform": {"formula": "hashicorp/tap/terraform"},
+        }
+        updater = HomebrewUpdater(
+            allowlist,
+            report=MaintenanceReport(),
+            index=HomebrewIndex.from_payloads(FORMULAE, CASKS),
+        )
+
+        with patch("maintenance_robot.homebrew.http_session.get") as get:
+            get.return_value.json.return_value = {"versions": {"stable": "1.14.0"}}
+            versions = updater.update_formulas()
+
+        self.assertEqual({"mise": "2026.10.1", "terraform": "1.14.0"}, versions)
+        get.assert_called_once_with(
+            "https://formulae.brew.sh/api/formula/hashicorp/tap/terraform.json",
+            timeout=30,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
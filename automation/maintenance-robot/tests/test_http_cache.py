@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+from maintenance_robot.http_cache import HTTPCache
+
+
+def _response(status_code: int, body: str = "", headers: dict[str, str] | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body.encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    return response
+
+
+class HTTPCacheTests(unittest.TestCase):
+    def test_revalidates_with_etag_and_reuses_body_on_not_modified(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = HTTPCache(Path(tmpdir))
+            sent_headers: list[dict[str, str]] = []
+            responses = [
+                _response(200, '{"info": {"version": "1.0.0"}}', {"ETag": '"abc"'}),
+                _response(304),
+            ]
+
+            def fake_get(url: str, headers: dict[str, str], timeout: float) -> requests.Response:
+                sent_headers.append(headers)
+                return responses.pop(0)
+
+            with patch("maintenance_robot.http_session.get", side_effect=fake_get):
+                first = cache.get("https://pypi.org/pypi/demo/json")
+                second = cache.get("https://pypi.org/pypi/demo/json")
+
+            self.assertFalse(first.from_cache)
+            self.assertTrue(second.from_cache)
+            self.assertEqual({"info": {"version": "1.0.0"}}, second.json())
+            self.assertNotIn("If-None-Match", sent_headers[0])
+            self.assertEqual('"abc"', sent_headers[1]["If-None-Match"])
+
+    def test_evicts_least_recently_used_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = HTTPCache(Path(tmpdir), max_entries=2)
+
+            def fake_get(url: str, headers: dict[str, str], timeout: float) -> requests.Response:
+                return _response(200, url, {"ETag": f'"{url}"'})
+
+            with patch("maintenance_robot.http_session.get", side_effect=fake_get):
+                for index in range(4):
+                    cache.get(f"https://example.invalid/{index}")
+
+            self.assertEqual(2, len(list(Path(tmpdir).glob("*.json"))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+import unittest
+from unittest.mock import patch
+
+from requests.structures import CaseInsensitiveDict
+
+from maintenance_robot import npm_api
+from maintenance_robot.http_cache import CachedResponse
+
+
+def _cached(url: str, payload: object) -> CachedResponse:
+    return CachedResponse(url=url, status_code=200, text=json.dumps(payload), headers=CaseInsensitiveDict(), from_cache=False)
+
+
+class NPMMetadataTests(unittest.TestCase):
+    def setUp(self) -> None:
+        npm_api.fetch_latest_version.cache_clear()
+
+    def test_latest_comes_from_dist_tags_endpoint(self) -> None:
+        requested: list[str] = []
+
+        def fake_cached_get(url: str, headers: dict[str, str] | None = None, timeout: float = 30) -> CachedResponse:
+            requested.append(url)
+            return _cached(url, {"latest": "0.80.1", "next": "0.81.0-beta.1"})
+
+        with patch.object(npm_api, "cached_get", side_effect=fake_cached_get):
+            info = npm_api.fetch_latest_version("@devcontainers/cli")
+
+        assert info is not None
+        self.assertEqual("0.80.1", info.version_str)
+        self.assertEqual(["https://registry.npmjs.org/-/package/@devcontainers%2Fcli/dist-tags"], requested)
+
+    def test_max_major_reads_abbreviated_version_list(self) -> None:
+        accepts: dict[str, str | None] = {}
+
+        def fake_cached_get(url: str, headers: dict[str, str] | None = None, timeout: float = 30) -> CachedResponse:
+            accepts[url] = (headers or {}).get("Accept")
+            if url.endswith("/dist-tags"):
+                return _cached(url, {"latest": "3.3.3"})
+            return _cached(url, {"dist-tags": {"latest": "3.3.3"}, "versions": {"2.8.7": {}, "2.8.8": {}, "3.3.3": {}}})
+
+        with patch.object(npm_api, "cached_get", side_effect=fake_cached_get):
+            info = npm_api.fetch_latest_version("prettier", max_major=2)
+
+        assert info is not None
+        self.assertEqual("2.8.8", info.version_str)
+        self.assertEqual(npm_api.NPM_ABBREVIATED_ACCEPT, accepts["https://registry.npmjs.org/prettier"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from maintenance_robot.oci_registry import DOCKER_HUB_REGISTRY, ImageReference, OCIRegistryClient
+
+INDEX_DIGEST = "sha256:" + "d" * 64
+
+
+class _RegistryStandIn(BaseHTTPRequestHandler):
+    """Just enough of the ``registry:2`` token-auth flow for manifest HEADs."""
+
+    token_requests = 0
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        if self.path.startswith("/token"):
+            type(self).token_requests += 1
+            body = json.dumps({"token": "anonymous", "expires_in": 300}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_error(404)
+
+    def do_HEAD(self) -> None:  # noqa: N802 - http.server API
+        if self.path != "/v2/chainguard/wolfi-base/manifests/latest":
+            self.send_error(404)
+            return
+        if self.headers.get("Authorization") != "Bearer anonymous":
+            host, port = self.server.server_address[:2]
+            self.send_response(401)
+            self.send_header(
+                "WWW-Authenticate",
+                f'Bearer realm="http://{host}:{port}/token",service="stand-in",scope="repository:chainguard/wolfi-base:pull"',
+            )
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Docker-Content-Digest", INDEX_DIGEST)
+        self.send_header("Content-Type", "application/vnd.oci.image.index.v1+json")
+        self.end_headers()
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+class OCIRegistryTests(unittest.TestCase):
+    def test_parses_registry_references(self) -> None:
+        self.assertEqual(ImageReference(DOCKER_HUB_REGISTRY, "library/docker", "29.0.0-cli"), ImageReference.parse("docker:29.0.0-cli"))
+        self.assertEqual(
+            ImageReference("cgr.dev", "chainguard/wolfi-base", "latest"),
+            ImageReference.parse("cgr.dev/chainguard/wolfi-base:latest@sha256:" + "a" * 64),
+        )
+        self.assertEqual(ImageReference("ghcr.io", "devcontainers/features/node", "1"), ImageReference.parse("ghcr.io/devcontainers/features/node", "1"))
+        self.assertEqual("http://localhost:5000/v2/x/y/manifests/latest", ImageReference.parse("localhost:5000/x/y").manifest_url)
+
+    def test_resolves_digest_with_cached_anonymous_token(self) -> None:
+        _RegistryStandIn.token_requests = 0
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _RegistryStandIn)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = OCIRegistryClient()
+            reference = f"127.0.0.1:{server.server_address[1]}/chainguard/wolfi-base:latest"
+            self.assertEqual(INDEX_DIGEST, client.resolve_digest(reference))
+            self.assertEqual(INDEX_DIGEST, client.resolve_digest(reference))
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(1, _RegistryStandIn.token_requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
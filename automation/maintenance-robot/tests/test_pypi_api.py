@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import unittest
+from unittest.mock import patch
+
+from requests.structures import CaseInsensitiveDict
+
+from maintenance_robot import pypi_api
+from maintenance_robot.http_cache import CachedResponse
+
+
+def _cached(url: str, payload: object) -> CachedResponse:
+    return CachedResponse(url=url, status_code=200, text=json.dumps(payload), headers=CaseInsensitiveDict(), from_cache=False)
+
+
+class PyPISimpleAPITests(unittest.TestCase):
+    def setUp(self) -> None:
+        pypi_api.fetch_latest_version.cache_clear()
+
+    def test_uses_simple_version_list_and_skips_yanked_releases(self) -> None:
+        documents = {
+            "https://pypi.org/simple/pre-commit/": {"versions": ["3.8.0", "4.0.0", "4.0.1", "4.1.0rc1"]},
+            "https://pypi.org/pypi/pre_commit/4.0.1/json": {"info": {"yanked": True}},
+            "https://pypi.org/pypi/pre_commit/4.0.0/json": {"info": {"yanked": False}},
+        }
+        requested: list[str] = []
+
+        def fake_cached_get(url: str, headers: dict[str, str] | None = None, timeout: float = 30) -> CachedResponse:
+            requested.append(url)
+            return _cached(url, documents[url])
+
+        with patch.object(pypi_api, "cached_get", side_effect=fake_cached_get):
+            info = pypi_api.fetch_latest_version("pre_commit")
+
+        assert info is not None
+        self.assertEqual("4.0.0", info.version_str)
+        self.assertNotIn("https://pypi.org/pypi/pre_commit/json", requested)
+
+    def test_falls_back_to_legacy_json_without_version_list(self) -> None:
+        documents = {
+            "https://pypi.org/simple/requests/": {"files": []},
+            "https://pypi.org/pypi/requests/json": {"info": {"version": "3.0.0"}, "releases": {"2.32.3": [], "3.0.0": []}},
+        }
+
+        def fake_cached_get(url: str, headers: dict[str, str] | None = None, timeout: float = 30) -> CachedResponse:
+            return _cached(url, documents[url])
+
+        with patch.object(pypi_api, "cached_get", side_effect=fake_cached_get):
+            info = pypi_api.fetch_latest_version("requests", max_major=2)
+
+        assert info is not None
+        self.assertEqual("2.32.3", info.version_str)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import unittest
+
+from packaging.version import Version
+
+from maintenance_robot.versions import allowed_version, parse_version, select_latest
+
+
+class VersionSelectionTests(unittest.TestCase):
+    def test_prefilter_rejects_non_versions_and_memoizes(self) -> None:
+        for tag in ("latest", "bookworm", "sha-1a2b3c4", "", "1.x"):
+            self.assertIsNone(parse_version(tag), tag)
+        self.assertEqual(Version("1!2.0.post1"), parse_version("1!2.0.post1"))
+        self.assertIs(parse_version("v4.2.0"), parse_version("v4.2.0"))
+
+    def test_constraints(self) -> None:
+        self.assertIsNone(allowed_version("2.0.0rc1"))
+        self.assertEqual(Version("2.0.0rc1"), allowed_version("2.0.0rc1", include_prerelease=True))
+        self.assertIsNone(allowed_version("3.0.0", max_major=2))
+
+    def test_select_latest_matches_sorted_selection(self) -> None:
+        tags = ["1.0", "latest", "2.1.0rc1", "1.10.0", "1.9.9", "1.10", "3.0.0"]
+        expected = sorted(((parse_version(t), t) for t in tags if allowed_version(t, max_major=2)), reverse=True)[0]
+        self.assertEqual(expected, select_latest(tags, max_major=2))
+        self.assertEqual((Version("3.0.0"), "3.0.0"), select_latest(tags, include_prerelease=True))
+        self.assertIsNone(select_latest(["latest", "edge"]))
+
+
+if __name__ == "__main__":
+    unittest.main()